@@ -3,9 +3,18 @@
 import sqlite3
 from collections.abc import Generator
 from contextlib import contextmanager
+from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
+# SQLite's special filename for a private, non-persistent in-memory database
+IN_MEMORY_DB = ":memory:"
+
+# Decimals are bound as TEXT and read back exactly: a result column aliased
+# as "name [DECIMAL]" is converted by PARSE_COLNAMES without passing through float
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_converter("DECIMAL", lambda value: Decimal(value.decode()))
+
 
 class DatabaseConnection:
     """
@@ -20,25 +29,38 @@ class DatabaseConnection:
         Initialize database connection
 
         Args:
-            db_path: Path to SQLite database file (created if not exists)
+            db_path: Path to SQLite database file (created if not exists),
+                or ":memory:" for a private in-memory database
         """
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if str(self.db_path) != IN_MEMORY_DB:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Initialize connection and enable foreign keys
         self._conn = sqlite3.connect(
             str(self.db_path),
             check_same_thread=False,  # Allow multi-threaded access
             isolation_level=None,  # Autocommit mode for manual transaction control
+            detect_types=sqlite3.PARSE_COLNAMES,  # Honour "col [DECIMAL]" aliases
         )
         self._conn.row_factory = sqlite3.Row  # Enable dict-like access
         self._conn.execute("PRAGMA foreign_keys = ON")
 
+        # WAL lets readers run alongside a writer; NORMAL is crash-safe under WAL
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA temp_store = MEMORY")
+        self._conn.execute("PRAGMA mmap_size = 268435456")  # 256 MiB
+        self._conn.execute("PRAGMA cache_size = -65536")  # 64 MiB (negative = KiB)
+
     @contextmanager
     def transaction(self) -> Generator[sqlite3.Connection, None, None]:
         """
         Context manager for database transactions
 
+        Nested use (inside an open transaction or SAVEPOINT) runs as a savepoint, so
+        only the inner block is rolled back on error.
+
         Yields:
             SQLite connection with transaction support
 
@@ -49,6 +71,17 @@ class DatabaseConnection:
                 # Automatically commits on success, rolls back on error
         """
         conn = self._conn
+        if conn.in_transaction:
+            conn.execute("SAVEPOINT nested_transaction")
+            try:
+                yield conn
+                conn.execute("RELEASE nested_transaction")
+            except Exception:
+                conn.execute("ROLLBACK TO nested_transaction")
+                conn.execute("RELEASE nested_transaction")
+                raise
+            return
+
         try:
             conn.execute("BEGIN")
             yield conn
@@ -133,6 +166,19 @@ class DatabaseConnection:
         cursor = self.execute(query, params)
         return [dict(row) for row in cursor.fetchall()]
 
+    def explain_query_plan(self, query: str, params: tuple[Any, ...] | None = None) -> list[str]:
+        """
+        Describe how SQLite will execute a query
+
+        Args:
+            query: SQL query string
+            params: Query parameters (optional)
+
+        Returns:
+            EXPLAIN QUERY PLAN detail lines (e.g. "SEARCH t USING INDEX ...")
+        """
+        return [row["detail"] for row in self.fetchall(f"EXPLAIN QUERY PLAN {query}", params)]
+
     def close(self) -> None:
         """Close database connection"""
         self._conn.close()
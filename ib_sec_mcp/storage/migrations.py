@@ -2,6 +2,35 @@
 
 from ib_sec_mcp.storage.database import DatabaseConnection
 
+# Secondary indexes on position_snapshots, keyed by name. Kept in one place so
+# bulk loads can drop and rebuild exactly what create_schema builds.
+POSITION_SNAPSHOT_INDEXES: dict[str, str] = {
+    "idx_account_date": """
+        CREATE INDEX IF NOT EXISTS idx_account_date
+        ON position_snapshots(account_id, snapshot_date)
+    """,
+    "idx_symbol_date": """
+        CREATE INDEX IF NOT EXISTS idx_symbol_date
+        ON position_snapshots(symbol, snapshot_date)
+    """,
+    "idx_account_symbol_date": """
+        CREATE INDEX IF NOT EXISTS idx_account_symbol_date
+        ON position_snapshots(account_id, symbol, snapshot_date)
+    """,
+    "idx_account_date_value": """
+        CREATE INDEX IF NOT EXISTS idx_account_date_value
+        ON position_snapshots(account_id, snapshot_date, CAST(position_value AS REAL) DESC)
+    """,
+    "idx_date": """
+        CREATE INDEX IF NOT EXISTS idx_date
+        ON position_snapshots(snapshot_date)
+    """,
+    "idx_asset_class": """
+        CREATE INDEX IF NOT EXISTS idx_asset_class
+        ON position_snapshots(asset_class)
+    """,
+}
+
 
 def create_schema(db: DatabaseConnection) -> None:
     """
@@ -63,30 +92,8 @@ def create_schema(db: DatabaseConnection) -> None:
         )
 
         # Indexes for efficient queries
-        conn.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_account_date
-            ON position_snapshots(account_id, snapshot_date)
-            """
-        )
-        conn.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_symbol_date
-            ON position_snapshots(symbol, snapshot_date)
-            """
-        )
-        conn.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_date
-            ON position_snapshots(snapshot_date)
-            """
-        )
-        conn.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_asset_class
-            ON position_snapshots(asset_class)
-            """
-        )
+        for index_sql in POSITION_SNAPSHOT_INDEXES.values():
+            conn.execute(index_sql)
 
         # Snapshot metadata table
         conn.execute(
@@ -203,12 +210,6 @@ def verify_schema(db: DatabaseConnection) -> bool:
         )
         indexes = {row[0] for row in cur.fetchall()}
 
-        expected_indexes = {
-            "idx_account_date",
-            "idx_symbol_date",
-            "idx_date",
-            "idx_asset_class",
-            "idx_snapshot_account_date",
-        }
+        expected_indexes = {*POSITION_SNAPSHOT_INDEXES, "idx_snapshot_account_date"}
 
         return expected_indexes.issubset(indexes)
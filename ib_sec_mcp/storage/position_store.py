@@ -1,5 +1,6 @@
 """Position snapshot storage and retrieval"""
 
+from collections.abc import Iterable
 from datetime import date
 from decimal import Decimal
 from pathlib import Path
@@ -7,7 +8,7 @@ from typing import Any
 
 from ib_sec_mcp.models.account import Account
 from ib_sec_mcp.storage.database import DatabaseConnection
-from ib_sec_mcp.storage.migrations import create_schema
+from ib_sec_mcp.storage.migrations import POSITION_SNAPSHOT_INDEXES, create_schema
 
 
 class PositionStore:
@@ -18,15 +19,216 @@ class PositionStore:
     Uses SQLite with TEXT storage for financial calculations.
     """
 
+    # SQL is kept together here for readability, and so tests can inspect query plans
+    _SQL_SAVE_METADATA = """
+        INSERT INTO snapshot_metadata
+        (account_id, snapshot_date, xml_file_path, date_range_from, date_range_to,
+         total_positions, total_value, total_cash)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(account_id, snapshot_date) DO UPDATE SET
+            xml_file_path = excluded.xml_file_path,
+            date_range_from = excluded.date_range_from,
+            date_range_to = excluded.date_range_to,
+            total_positions = excluded.total_positions,
+            total_value = excluded.total_value,
+            total_cash = excluded.total_cash
+    """
+
+    _SQL_SAVE_POSITIONS = """
+        INSERT INTO position_snapshots
+        (account_id, snapshot_date, symbol, description, asset_class,
+         cusip, isin, quantity, multiplier, mark_price, position_value,
+         average_cost, cost_basis, unrealized_pnl, realized_pnl,
+         currency, fx_rate_to_base, coupon_rate, maturity_date, ytm, duration)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(account_id, snapshot_date, symbol) DO UPDATE SET
+            description = excluded.description,
+            asset_class = excluded.asset_class,
+            cusip = excluded.cusip,
+            isin = excluded.isin,
+            quantity = excluded.quantity,
+            multiplier = excluded.multiplier,
+            mark_price = excluded.mark_price,
+            position_value = excluded.position_value,
+            average_cost = excluded.average_cost,
+            cost_basis = excluded.cost_basis,
+            unrealized_pnl = excluded.unrealized_pnl,
+            realized_pnl = excluded.realized_pnl,
+            currency = excluded.currency,
+            fx_rate_to_base = excluded.fx_rate_to_base,
+            coupon_rate = excluded.coupon_rate,
+            maturity_date = excluded.maturity_date,
+            ytm = excluded.ytm,
+            duration = excluded.duration
+    """
+
+    # "[DECIMAL]" aliases make the driver return Decimal for the TEXT columns
+    _SQL_GET_HISTORY = """
+        SELECT
+            snapshot_date,
+            symbol,
+            description,
+            asset_class,
+            quantity AS "quantity [DECIMAL]",
+            mark_price AS "mark_price [DECIMAL]",
+            position_value AS "position_value [DECIMAL]",
+            average_cost AS "average_cost [DECIMAL]",
+            cost_basis AS "cost_basis [DECIMAL]",
+            unrealized_pnl AS "unrealized_pnl [DECIMAL]",
+            realized_pnl AS "realized_pnl [DECIMAL]",
+            currency
+        FROM position_snapshots
+        WHERE account_id = ?
+            AND symbol = ?
+            AND snapshot_date >= ?
+            AND snapshot_date <= ?
+        ORDER BY snapshot_date ASC
+    """
+
+    # "[DECIMAL]" aliases make the driver return Decimal for the TEXT columns.
+    # Ordering casts to REAL (TEXT would sort lexicographically) and matches
+    # idx_account_date_value, so SQLite reads rows in order without a sort step.
+    _SQL_GET_SNAPSHOT = """
+        SELECT
+            symbol,
+            description,
+            asset_class,
+            quantity AS "quantity [DECIMAL]",
+            mark_price AS "mark_price [DECIMAL]",
+            position_value AS "position_value [DECIMAL]",
+            average_cost AS "average_cost [DECIMAL]",
+            cost_basis AS "cost_basis [DECIMAL]",
+            unrealized_pnl AS "unrealized_pnl [DECIMAL]",
+            realized_pnl AS "realized_pnl [DECIMAL]",
+            currency,
+            coupon_rate AS "coupon_rate [DECIMAL]",
+            maturity_date
+        FROM position_snapshots
+        WHERE account_id = ?
+            AND snapshot_date = ?
+        ORDER BY CAST(position_value AS REAL) DESC
+    """
+
+    # FULL OUTER JOIN of the two snapshots on symbol, emulated as a LEFT JOIN
+    # plus the date2-only rows. Params: date2, account_id, date1, account_id, date2, date1.
+    # Values stay TEXT -> Decimal; the arithmetic is done in Python to keep precision.
+    _SQL_COMPARE_SNAPSHOTS = """
+        SELECT
+            a.symbol AS symbol,
+            a.position_value AS "value_date1 [DECIMAL]",
+            b.position_value AS "value_date2 [DECIMAL]"
+        FROM position_snapshots a
+        LEFT JOIN position_snapshots b
+            ON b.account_id = a.account_id
+            AND b.symbol = a.symbol
+            AND b.snapshot_date = ?
+        WHERE a.account_id = ?
+            AND a.snapshot_date = ?
+        UNION ALL
+        SELECT
+            b.symbol,
+            NULL,
+            b.position_value
+        FROM position_snapshots b
+        WHERE b.account_id = ?
+            AND b.snapshot_date = ?
+            AND NOT EXISTS (
+                SELECT 1
+                FROM position_snapshots a
+                WHERE a.account_id = b.account_id
+                    AND a.symbol = b.symbol
+                    AND a.snapshot_date = ?
+            )
+        ORDER BY symbol
+    """
+
+    # One aggregate row. Min/max return the stored TEXT (as Decimal) of the extreme
+    # row instead of a REAL, so no precision is lost. Values that tie as REAL share
+    # their integer part, so their text orders them (reversed for negatives).
+    _SQL_GET_STATISTICS = """
+        WITH history AS (
+            SELECT mark_price, position_value, unrealized_pnl
+            FROM position_snapshots
+            WHERE account_id = ?
+                AND symbol = ?
+                AND snapshot_date >= ?
+                AND snapshot_date <= ?
+        )
+        SELECT
+            COUNT(*) AS snapshot_count,
+            (
+                SELECT mark_price FROM history
+                ORDER BY CAST(mark_price AS REAL),
+                    IIF(mark_price LIKE '-%', NULL, mark_price),
+                    mark_price DESC
+                LIMIT 1
+            ) AS "min_price [DECIMAL]",
+            (
+                SELECT mark_price FROM history
+                ORDER BY CAST(mark_price AS REAL) DESC,
+                    IIF(mark_price LIKE '-%', NULL, mark_price) DESC,
+                    mark_price
+                LIMIT 1
+            ) AS "max_price [DECIMAL]",
+            AVG(CAST(mark_price AS REAL)) AS avg_price,
+            (
+                SELECT position_value FROM history
+                ORDER BY CAST(position_value AS REAL),
+                    IIF(position_value LIKE '-%', NULL, position_value),
+                    position_value DESC
+                LIMIT 1
+            ) AS "min_value [DECIMAL]",
+            (
+                SELECT position_value FROM history
+                ORDER BY CAST(position_value AS REAL) DESC,
+                    IIF(position_value LIKE '-%', NULL, position_value) DESC,
+                    position_value
+                LIMIT 1
+            ) AS "max_value [DECIMAL]",
+            AVG(CAST(position_value AS REAL)) AS avg_value,
+            (
+                SELECT unrealized_pnl FROM history
+                ORDER BY CAST(unrealized_pnl AS REAL),
+                    IIF(unrealized_pnl LIKE '-%', NULL, unrealized_pnl),
+                    unrealized_pnl DESC
+                LIMIT 1
+            ) AS "min_pnl [DECIMAL]",
+            (
+                SELECT unrealized_pnl FROM history
+                ORDER BY CAST(unrealized_pnl AS REAL) DESC,
+                    IIF(unrealized_pnl LIKE '-%', NULL, unrealized_pnl) DESC,
+                    unrealized_pnl
+                LIMIT 1
+            ) AS "max_pnl [DECIMAL]",
+            AVG(CAST(unrealized_pnl AS REAL)) AS avg_pnl
+        FROM history
+    """
+
+    # One metadata row per (account, date), so no position rows are scanned;
+    # idx_snapshot_account_date covers the lookup and the DESC order (walked backwards).
+    _SQL_GET_DATES = """
+        SELECT DISTINCT snapshot_date
+        FROM snapshot_metadata
+        WHERE account_id = ?
+        ORDER BY snapshot_date DESC
+    """
+
     def __init__(self, db_path: str | Path = "data/processed/positions.db"):
         """
         Initialize position store
 
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, or ":memory:" for a private
+                in-memory database
         """
         self.db = DatabaseConnection(db_path)
 
+        # Snapshot and history reads dominate, so map more of the file and keep a
+        # larger page cache than the DatabaseConnection defaults (both are ceilings;
+        # the cache fills lazily)
+        self.db.execute("PRAGMA mmap_size = 1073741824")  # 1 GiB
+        self.db.execute("PRAGMA cache_size = -204800")  # 200 MiB (negative = KiB)
+
         # Ensure schema exists
         create_schema(self.db)
 
@@ -42,67 +244,100 @@ class PositionStore:
         Returns:
             Number of positions saved
         """
-        positions_saved = 0
+        snapshot_date_str = snapshot_date.isoformat()
+        position_rows = self._position_rows(account, snapshot_date_str)
 
         with self.db.transaction() as conn:
             # Save snapshot metadata
             conn.execute(
-                """
-                INSERT OR REPLACE INTO snapshot_metadata
-                (account_id, snapshot_date, xml_file_path, date_range_from, date_range_to,
-                 total_positions, total_value, total_cash)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    account.account_id,
-                    snapshot_date.isoformat(),
-                    xml_file_path,
-                    account.from_date.isoformat(),
-                    account.to_date.isoformat(),
-                    len(account.positions),
-                    str(account.total_value),
-                    str(account.total_cash),
-                ),
+                self._SQL_SAVE_METADATA,
+                self._metadata_row(account, snapshot_date_str, xml_file_path),
             )
 
-            # Save positions
-            for position in account.positions:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO position_snapshots
-                    (account_id, snapshot_date, symbol, description, asset_class,
-                     cusip, isin, quantity, multiplier, mark_price, position_value,
-                     average_cost, cost_basis, unrealized_pnl, realized_pnl,
-                     currency, fx_rate_to_base, coupon_rate, maturity_date, ytm, duration)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        position.account_id,
-                        snapshot_date.isoformat(),
-                        position.symbol,
-                        position.description,
-                        position.asset_class.value,
-                        position.cusip,
-                        position.isin,
-                        str(position.quantity),
-                        str(position.multiplier),
-                        str(position.mark_price),
-                        str(position.position_value),
-                        str(position.average_cost),
-                        str(position.cost_basis),
-                        str(position.unrealized_pnl),
-                        str(position.realized_pnl),
-                        position.currency,
-                        str(position.fx_rate_to_base),
-                        str(position.coupon_rate) if position.coupon_rate else None,
-                        position.maturity_date.isoformat() if position.maturity_date else None,
-                        str(position.ytm) if position.ytm else None,
-                        str(position.duration) if position.duration else None,
-                    ),
-                )
-                positions_saved += 1
+            # Save positions in one batched statement; re-imports update rows in place
+            conn.executemany(self._SQL_SAVE_POSITIONS, position_rows)
+
+        return len(position_rows)
 
-        return positions_saved
+    def bulk_load(self, snapshots: Iterable[tuple[Account, date, str]]) -> int:
+        """
+        Save many snapshots with position indexes rebuilt once at the end
+
+        Drops the secondary indexes on position_snapshots, inserts every row,
+        then recreates the indexes, all in one transaction. Rebuilding covers
+        the whole table, so this pays off for initial population, not for
+        adding a snapshot to a large existing database.
+
+        Args:
+            snapshots: (account, snapshot_date, xml_file_path) tuples
+
+        Returns:
+            Number of positions saved
+        """
+        metadata_rows = []
+        position_rows = []
+        for account, snapshot_date, xml_file_path in snapshots:
+            snapshot_date_str = snapshot_date.isoformat()
+            metadata_rows.append(self._metadata_row(account, snapshot_date_str, xml_file_path))
+            position_rows.extend(self._position_rows(account, snapshot_date_str))
+
+        with self.db.transaction() as conn:
+            for index_name in POSITION_SNAPSHOT_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+            conn.executemany(self._SQL_SAVE_METADATA, metadata_rows)
+            conn.executemany(self._SQL_SAVE_POSITIONS, position_rows)
+
+            for index_sql in POSITION_SNAPSHOT_INDEXES.values():
+                conn.execute(index_sql)
+
+        return len(position_rows)
+
+    @staticmethod
+    def _metadata_row(
+        account: Account, snapshot_date_str: str, xml_file_path: str
+    ) -> tuple[Any, ...]:
+        """Build _SQL_SAVE_METADATA parameters for one account snapshot"""
+        return (
+            account.account_id,
+            snapshot_date_str,
+            xml_file_path,
+            account.from_date.isoformat(),
+            account.to_date.isoformat(),
+            len(account.positions),
+            account.total_value,
+            account.total_cash,
+        )
+
+    @staticmethod
+    def _position_rows(account: Account, snapshot_date_str: str) -> list[tuple[Any, ...]]:
+        """Build _SQL_SAVE_POSITIONS parameters for every position in the account"""
+        return [
+            (
+                position.account_id,
+                snapshot_date_str,
+                position.symbol,
+                position.description,
+                position.asset_class,
+                position.cusip,
+                position.isin,
+                position.quantity,
+                position.multiplier,
+                position.mark_price,
+                position.position_value,
+                position.average_cost,
+                position.cost_basis,
+                position.unrealized_pnl,
+                position.realized_pnl,
+                position.currency,
+                position.fx_rate_to_base,
+                position.coupon_rate or None,
+                position.maturity_date.isoformat() if position.maturity_date else None,
+                position.ytm or None,
+                position.duration or None,
+            )
+            for position in account.positions
+        ]
 
     def get_position_history(
         self,
@@ -123,43 +358,12 @@ class PositionStore:
         Returns:
             List of position snapshots ordered by date
         """
-        query = """
-            SELECT
-                snapshot_date,
-                symbol,
-                description,
-                asset_class,
-                quantity,
-                mark_price,
-                position_value,
-                average_cost,
-                cost_basis,
-                unrealized_pnl,
-                realized_pnl,
-                currency
-            FROM position_snapshots
-            WHERE account_id = ?
-                AND symbol = ?
-                AND snapshot_date >= ?
-                AND snapshot_date <= ?
-            ORDER BY snapshot_date ASC
-        """
 
         results = self.db.fetchall(
-            query,
+            self._SQL_GET_HISTORY,
             (account_id, symbol, start_date.isoformat(), end_date.isoformat()),
         )
 
-        # Convert TEXT fields back to Decimal
-        for row in results:
-            row["quantity"] = Decimal(row["quantity"])
-            row["mark_price"] = Decimal(row["mark_price"])
-            row["position_value"] = Decimal(row["position_value"])
-            row["average_cost"] = Decimal(row["average_cost"])
-            row["cost_basis"] = Decimal(row["cost_basis"])
-            row["unrealized_pnl"] = Decimal(row["unrealized_pnl"])
-            row["realized_pnl"] = Decimal(row["realized_pnl"])
-
         return results
 
     def get_portfolio_snapshot(self, account_id: str, snapshot_date: date) -> list[dict[str, Any]]:
@@ -171,42 +375,9 @@ class PositionStore:
             snapshot_date: Snapshot date
 
         Returns:
-            List of positions on that date
+            List of positions on that date, largest position value first
         """
-        query = """
-            SELECT
-                symbol,
-                description,
-                asset_class,
-                quantity,
-                mark_price,
-                position_value,
-                average_cost,
-                cost_basis,
-                unrealized_pnl,
-                realized_pnl,
-                currency,
-                coupon_rate,
-                maturity_date
-            FROM position_snapshots
-            WHERE account_id = ?
-                AND snapshot_date = ?
-            ORDER BY position_value DESC
-        """
-
-        results = self.db.fetchall(query, (account_id, snapshot_date.isoformat()))
-
-        # Convert TEXT fields back to Decimal
-        for row in results:
-            row["quantity"] = Decimal(row["quantity"])
-            row["mark_price"] = Decimal(row["mark_price"])
-            row["position_value"] = Decimal(row["position_value"])
-            row["average_cost"] = Decimal(row["average_cost"])
-            row["cost_basis"] = Decimal(row["cost_basis"])
-            row["unrealized_pnl"] = Decimal(row["unrealized_pnl"])
-            row["realized_pnl"] = Decimal(row["realized_pnl"])
-            if row["coupon_rate"]:
-                row["coupon_rate"] = Decimal(row["coupon_rate"])
+        results = self.db.fetchall(self._SQL_GET_SNAPSHOT, (account_id, snapshot_date.isoformat()))
 
         return results
 
@@ -224,41 +395,45 @@ class PositionStore:
         Returns:
             Dictionary with comparison statistics
         """
-        snapshot1 = self.get_portfolio_snapshot(account_id, date1)
-        snapshot2 = self.get_portfolio_snapshot(account_id, date2)
-
-        # Build symbol sets
-        symbols1 = {pos["symbol"] for pos in snapshot1}
-        symbols2 = {pos["symbol"] for pos in snapshot2}
-
-        # Identify changes
-        added = symbols2 - symbols1
-        removed = symbols1 - symbols2
-        common = symbols1 & symbols2
-
-        # Calculate value changes
-        pos_map1 = {pos["symbol"]: pos for pos in snapshot1}
-        pos_map2 = {pos["symbol"]: pos for pos in snapshot2}
-
-        total_value1 = sum((pos["position_value"] for pos in snapshot1), Decimal("0"))
-        total_value2 = sum((pos["position_value"] for pos in snapshot2), Decimal("0"))
+        date1_str = date1.isoformat()
+        date2_str = date2.isoformat()
 
+        # Classify each symbol in one pass over the joined rows
+        added: list[str] = []
+        removed: list[str] = []
         changes = []
-        for symbol in common:
-            value1 = pos_map1[symbol]["position_value"]
-            value2 = pos_map2[symbol]["position_value"]
-            change = value2 - value1
-            change_pct = (change / value1 * 100) if value1 != 0 else Decimal("0")
-
-            changes.append(
-                {
-                    "symbol": symbol,
-                    "value_change": change,
-                    "value_change_pct": change_pct,
-                    "value_date1": value1,
-                    "value_date2": value2,
-                }
+        total_value1 = Decimal("0")
+        total_value2 = Decimal("0")
+        with self.db.cursor() as cur:
+            # Plain tuples (no sqlite3.Row/dict per row); unpacked in SELECT order
+            cur.row_factory = None
+            cur.execute(
+                self._SQL_COMPARE_SNAPSHOTS,
+                (date2_str, account_id, date1_str, account_id, date2_str, date1_str),
             )
+            for symbol, value1, value2 in cur:
+                if value1 is None:
+                    added.append(symbol)
+                    total_value2 += value2
+                    continue
+                total_value1 += value1
+                if value2 is None:
+                    removed.append(symbol)
+                    continue
+                total_value2 += value2
+
+                change = value2 - value1
+                change_pct = (change / value1 * 100) if value1 != 0 else Decimal("0")
+
+                changes.append(
+                    {
+                        "symbol": symbol,
+                        "value_change": change,
+                        "value_change_pct": change_pct,
+                        "value_date1": value1,
+                        "value_date2": value2,
+                    }
+                )
 
         # Sort by absolute change
         changes.sort(key=lambda x: abs(x["value_change"]), reverse=True)
@@ -274,8 +449,8 @@ class PositionStore:
                 if total_value1 != 0
                 else Decimal("0")
             ),
-            "positions_added": list(added),
-            "positions_removed": list(removed),
+            "positions_added": added,
+            "positions_removed": removed,
             "positions_changed": changes,
         }
 
@@ -298,27 +473,9 @@ class PositionStore:
         Returns:
             Dictionary with min/max/avg statistics
         """
-        query = """
-            SELECT
-                COUNT(*) as snapshot_count,
-                MIN(mark_price) as min_price,
-                MAX(mark_price) as max_price,
-                AVG(CAST(mark_price AS REAL)) as avg_price,
-                MIN(position_value) as min_value,
-                MAX(position_value) as max_value,
-                AVG(CAST(position_value AS REAL)) as avg_value,
-                MIN(unrealized_pnl) as min_pnl,
-                MAX(unrealized_pnl) as max_pnl,
-                AVG(CAST(unrealized_pnl AS REAL)) as avg_pnl
-            FROM position_snapshots
-            WHERE account_id = ?
-                AND symbol = ?
-                AND snapshot_date >= ?
-                AND snapshot_date <= ?
-        """
 
         result = self.db.fetchone(
-            query,
+            self._SQL_GET_STATISTICS,
             (account_id, symbol, start_date.isoformat(), end_date.isoformat()),
         )
 
@@ -334,18 +491,18 @@ class PositionStore:
             "date_range": {"from": start_date.isoformat(), "to": end_date.isoformat()},
             "snapshot_count": result["snapshot_count"],
             "price_statistics": {
-                "min": Decimal(str(result["min_price"])),
-                "max": Decimal(str(result["max_price"])),
+                "min": result["min_price"],
+                "max": result["max_price"],
                 "avg": Decimal(str(result["avg_price"])),
             },
             "value_statistics": {
-                "min": Decimal(str(result["min_value"])),
-                "max": Decimal(str(result["max_value"])),
+                "min": result["min_value"],
+                "max": result["max_value"],
                 "avg": Decimal(str(result["avg_value"])),
             },
             "pnl_statistics": {
-                "min": Decimal(str(result["min_pnl"])),
-                "max": Decimal(str(result["max_pnl"])),
+                "min": result["min_pnl"],
+                "max": result["max_pnl"],
                 "avg": Decimal(str(result["avg_pnl"])),
             },
         }
@@ -360,14 +517,7 @@ class PositionStore:
         Returns:
             List of dates with snapshots (ISO format)
         """
-        query = """
-            SELECT DISTINCT snapshot_date
-            FROM snapshot_metadata
-            WHERE account_id = ?
-            ORDER BY snapshot_date DESC
-        """
-
-        results = self.db.fetchall(query, (account_id,))
+        results = self.db.fetchall(self._SQL_GET_DATES, (account_id,))
         return [row["snapshot_date"] for row in results]
 
     def close(self) -> None:
@@ -28,22 +28,10 @@ U12345678,STK,MSFT,50,300.00"""
 
 
 @pytest.fixture
-def clean_cache():
-    """Clean cache before and after test"""
-    data_dir = Path("data/raw")
-    # Clean before
-    if data_dir.exists():
-        for f in data_dir.glob("*.csv"):
-            f.unlink()
-        for f in data_dir.glob("*.xml"):
-            f.unlink()
-    yield
-    # Clean after
-    if data_dir.exists():
-        for f in data_dir.glob("*.csv"):
-            f.unlink()
-        for f in data_dir.glob("*.xml"):
-            f.unlink()
+def clean_cache(tmp_path, monkeypatch):
+    """Run from tmp_path so the relative data/raw cache is per-test (xdist-safe)"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "data" / "raw"
 
 
 class TestGetOrFetchData:
@@ -4,8 +4,10 @@ Verifies that the server starts correctly and all expected tools and resources a
 """
 
 import asyncio
+import functools
 
 import pytest
+import pytest_asyncio
 from fastmcp import FastMCP
 
 from ib_sec_mcp.mcp.resources import (
@@ -129,28 +131,49 @@ EXPECTED_RESOURCE_TEMPLATES = {
 }
 
 
-class TestMCPServerStartup:
-    """Smoke tests for Issue #52: MCP server startup and component registration"""
+@functools.lru_cache(maxsize=2)
+def _cached_server(enable_debug: bool) -> FastMCP:
+    """Build each server variant at most once per test session."""
+    return create_server(enable_debug=enable_debug)
+
+
+@pytest.fixture(scope="module")
+def server() -> FastMCP:
+    """Create a server instance for testing (no network calls)"""
+    return _cached_server(enable_debug=False)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def registered_components(server: FastMCP) -> tuple[set[str], set[str], set[str]]:
+    """Fetch tool names, resource URIs, and template URIs concurrently once per module."""
+    tools, resources, templates = await asyncio.gather(
+        list_tool_names(server),
+        list_resource_uris(server),
+        list_resource_template_uris(server),
+    )
+    return tools, resources, templates
 
-    @pytest.fixture(scope="class")
-    def server(self) -> FastMCP:
-        """Create a server instance for testing (no network calls)"""
-        return create_server()
 
-    @pytest.fixture(scope="class")
-    def registered_tools(self, server: FastMCP) -> set[str]:
-        """Fetch registered tool names once for all tests in the class."""
-        return asyncio.run(list_tool_names(server))
+@pytest.fixture(scope="module")
+def registered_tools(registered_components: tuple[set[str], ...]) -> set[str]:
+    """Registered tool names."""
+    return registered_components[0]
 
-    @pytest.fixture(scope="class")
-    def registered_resources(self, server: FastMCP) -> set[str]:
-        """Fetch registered static resource URIs once for all tests in the class."""
-        return asyncio.run(list_resource_uris(server))
 
-    @pytest.fixture(scope="class")
-    def registered_templates(self, server: FastMCP) -> set[str]:
-        """Fetch registered resource template URIs once for all tests in the class."""
-        return asyncio.run(list_resource_template_uris(server))
+@pytest.fixture(scope="module")
+def registered_resources(registered_components: tuple[set[str], ...]) -> set[str]:
+    """Registered static resource URIs."""
+    return registered_components[1]
+
+
+@pytest.fixture(scope="module")
+def registered_templates(registered_components: tuple[set[str], ...]) -> set[str]:
+    """Registered resource template URIs."""
+    return registered_components[2]
+
+
+class TestMCPServerStartup:
+    """Smoke tests for Issue #52: MCP server startup and component registration"""
 
     def test_server_is_fastmcp_instance(self, server: FastMCP) -> None:
         """create_server() returns a FastMCP instance"""
@@ -179,10 +202,10 @@ class TestMCPServerStartup:
 
     def test_server_starts_without_credentials(self) -> None:
         """Server creation requires no API credentials or network calls"""
-        server = create_server(enable_debug=False)
+        server = _cached_server(enable_debug=False)
         assert isinstance(server, FastMCP)
 
     def test_debug_mode_server_creation(self) -> None:
         """create_server(enable_debug=True) also creates a valid FastMCP instance"""
-        debug_server = create_server(enable_debug=True)
+        debug_server = _cached_server(enable_debug=True)
         assert isinstance(debug_server, FastMCP)
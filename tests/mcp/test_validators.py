@@ -15,13 +15,26 @@ from ib_sec_mcp.mcp.validators import (
     validate_symbol,
 )
 
+# Canonical valid inputs shared by the parametrized positive-case tests
+VALID_INPUTS: dict[str, tuple[str, ...]] = {
+    "period": ("1mo", "1y", "max"),
+    "interval": ("1d", "1h", "1wk"),
+}
+
+# Valid date strings mapped to their parsed value
+VALID_DATES: dict[str, date] = {
+    "2025-01-15": date(2025, 1, 15),
+    "2024-02-29": date(2024, 2, 29),
+    "2025-12-31": date(2025, 12, 31),
+}
+
 
 class TestDateValidation:
     """Test date validation functions"""
 
-    def test_valid_date_string(self):
-        result = validate_date_string("2025-01-15")
-        assert result == date(2025, 1, 15)
+    @pytest.mark.parametrize(("value", "expected"), VALID_DATES.items())
+    def test_valid_date_string(self, value, expected):
+        assert validate_date_string(value) == expected
 
     def test_invalid_date_format(self):
         with pytest.raises(ValidationError) as exc_info:
@@ -44,10 +57,12 @@ class TestDateValidation:
 class TestSymbolValidation:
     """Test stock symbol validation"""
 
-    def test_valid_symbol(self):
-        assert validate_symbol("AAPL") == "AAPL"
-        assert validate_symbol("voo") == "VOO"
-        assert validate_symbol("BRK.B") == "BRK.B"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("AAPL", "AAPL"), ("voo", "VOO"), ("BRK.B", "BRK.B")],
+    )
+    def test_valid_symbol(self, value, expected):
+        assert validate_symbol(value) == expected
 
     def test_invalid_symbol(self):
         with pytest.raises(ValidationError):
@@ -60,10 +75,9 @@ class TestSymbolValidation:
 class TestPeriodValidation:
     """Test period validation"""
 
-    def test_valid_periods(self):
-        assert validate_period("1mo") == "1mo"
-        assert validate_period("1y") == "1y"
-        assert validate_period("max") == "max"
+    @pytest.mark.parametrize("value", VALID_INPUTS["period"])
+    def test_valid_periods(self, value):
+        assert validate_period(value) == value
 
     def test_invalid_period(self):
         with pytest.raises(ValidationError) as exc_info:
@@ -74,10 +88,9 @@ class TestPeriodValidation:
 class TestIntervalValidation:
     """Test interval validation"""
 
-    def test_valid_intervals(self):
-        assert validate_interval("1d") == "1d"
-        assert validate_interval("1h") == "1h"
-        assert validate_interval("1wk") == "1wk"
+    @pytest.mark.parametrize("value", VALID_INPUTS["interval"])
+    def test_valid_intervals(self, value):
+        assert validate_interval(value) == value
 
     def test_invalid_interval(self):
         with pytest.raises(ValidationError) as exc_info:
@@ -88,13 +101,16 @@ class TestIntervalValidation:
 class TestIndicatorValidation:
     """Test indicator validation"""
 
-    def test_valid_indicators(self):
-        result = validate_indicators("sma_20,rsi,macd")
-        assert result == ["sma_20", "rsi", "macd"]
-
-    def test_custom_sma_ema(self):
-        result = validate_indicators("sma_100,ema_50")
-        assert result == ["sma_100", "ema_50"]
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("sma_20,rsi,macd", ["sma_20", "rsi", "macd"]),
+            ("sma_100,ema_50", ["sma_100", "ema_50"]),
+        ],
+        ids=["builtin", "custom-sma-ema"],
+    )
+    def test_valid_indicators(self, value, expected):
+        assert validate_indicators(value) == expected
 
     def test_invalid_indicator(self):
         with pytest.raises(ValidationError) as exc_info:
@@ -10,76 +10,82 @@ from ib_sec_mcp.models.account import Account, CashBalance
 from ib_sec_mcp.models.position import Position
 from ib_sec_mcp.models.trade import AssetClass, BuySell, Trade
 
-
-@pytest.fixture
+# Shared Decimal literals
+_D0 = Decimal("0")
+_D100 = Decimal("100.00")
+
+# Read-only sample models built once at import. Fixtures hand out these shared
+# instances, so take a ``model_copy(deep=True)`` in any test that needs to mutate one.
+_SAMPLE_CASH_BALANCE = CashBalance(
+    currency="USD",
+    starting_cash=Decimal("10000.00"),
+    ending_cash=Decimal("11000.00"),
+    ending_settled_cash=Decimal("10500.00"),
+    deposits=Decimal("2000.00"),
+    withdrawals=Decimal("500.00"),
+    dividends=_D100,
+    interest=Decimal("50.00"),
+    commissions=Decimal("-25.00"),
+    fees=Decimal("-10.00"),
+    net_trades_sales=Decimal("5000.00"),
+    net_trades_purchases=Decimal("-4000.00"),
+)
+
+_SAMPLE_POSITION = Position(
+    account_id="U1234567",
+    symbol="AAPL",
+    asset_class=AssetClass.STOCK,
+    quantity=Decimal("100"),
+    mark_price=Decimal("150.00"),
+    position_value=Decimal("15000.00"),
+    average_cost=Decimal("120.00"),
+    cost_basis=Decimal("12000.00"),
+    unrealized_pnl=Decimal("3000.00"),
+    position_date=date(2025, 6, 30),
+)
+
+_SAMPLE_TRADE = Trade(
+    account_id="U1234567",
+    trade_id="T001",
+    trade_date=date(2025, 1, 15),
+    symbol="AAPL",
+    asset_class=AssetClass.STOCK,
+    buy_sell=BuySell.BUY,
+    quantity=Decimal("100"),
+    trade_price=Decimal("120.00"),
+    trade_money=Decimal("-12000.00"),
+    ib_commission=Decimal("-1.50"),
+    fifo_pnl_realized=Decimal("500.00"),
+)
+
+
+@pytest.fixture(scope="module")
 def sample_cash_balance() -> CashBalance:
-    """Create a sample cash balance."""
-    return CashBalance(
-        currency="USD",
-        starting_cash=Decimal("10000.00"),
-        ending_cash=Decimal("11000.00"),
-        ending_settled_cash=Decimal("10500.00"),
-        deposits=Decimal("2000.00"),
-        withdrawals=Decimal("500.00"),
-        dividends=Decimal("100.00"),
-        interest=Decimal("50.00"),
-        commissions=Decimal("-25.00"),
-        fees=Decimal("-10.00"),
-        net_trades_sales=Decimal("5000.00"),
-        net_trades_purchases=Decimal("-4000.00"),
-    )
-
+    """Sample USD cash balance."""
+    return _SAMPLE_CASH_BALANCE
 
-@pytest.fixture
-def sample_position() -> Position:
-    """Create a sample position."""
-    return Position(
-        account_id="U1234567",
-        symbol="AAPL",
-        asset_class=AssetClass.STOCK,
-        quantity=Decimal("100"),
-        mark_price=Decimal("150.00"),
-        position_value=Decimal("15000.00"),
-        average_cost=Decimal("120.00"),
-        cost_basis=Decimal("12000.00"),
-        unrealized_pnl=Decimal("3000.00"),
-        position_date=date(2025, 6, 30),
-    )
 
-
-@pytest.fixture
-def sample_trade() -> Trade:
-    """Create a sample trade."""
-    return Trade(
+@pytest.fixture(scope="module")
+def sample_account() -> Account:
+    """Create a sample account with positions and trades."""
+    return Account(
         account_id="U1234567",
-        trade_id="T001",
-        trade_date=date(2025, 1, 15),
-        symbol="AAPL",
-        asset_class=AssetClass.STOCK,
-        buy_sell=BuySell.BUY,
-        quantity=Decimal("100"),
-        trade_price=Decimal("120.00"),
-        trade_money=Decimal("-12000.00"),
-        ib_commission=Decimal("-1.50"),
-        fifo_pnl_realized=Decimal("500.00"),
+        account_alias="Test Account",
+        from_date=date(2025, 1, 1),
+        to_date=date(2025, 6, 30),
+        cash_balances=[_SAMPLE_CASH_BALANCE],
+        positions=[_SAMPLE_POSITION],
+        trades=[_SAMPLE_TRADE],
     )
 
 
-@pytest.fixture
-def sample_account(
-    sample_cash_balance: CashBalance,
-    sample_position: Position,
-    sample_trade: Trade,
-) -> Account:
-    """Create a sample account with positions and trades."""
+@pytest.fixture(scope="module")
+def empty_account() -> Account:
+    """Create an account with no balances, positions, or trades."""
     return Account(
         account_id="U1234567",
-        account_alias="Test Account",
         from_date=date(2025, 1, 1),
         to_date=date(2025, 6, 30),
-        cash_balances=[sample_cash_balance],
-        positions=[sample_position],
-        trades=[sample_trade],
     )
 
 
@@ -98,14 +104,14 @@ class TestCashBalance:
             ending_cash=Decimal("11000.00"),
             ending_settled_cash=Decimal("10500.00"),
         )
-        assert balance.deposits == Decimal("0")
-        assert balance.withdrawals == Decimal("0")
-        assert balance.dividends == Decimal("0")
-        assert balance.interest == Decimal("0")
-        assert balance.commissions == Decimal("0")
-        assert balance.fees == Decimal("0")
-        assert balance.net_trades_sales == Decimal("0")
-        assert balance.net_trades_purchases == Decimal("0")
+        assert balance.deposits == _D0
+        assert balance.withdrawals == _D0
+        assert balance.dividends == _D0
+        assert balance.interest == _D0
+        assert balance.commissions == _D0
+        assert balance.fees == _D0
+        assert balance.net_trades_sales == _D0
+        assert balance.net_trades_purchases == _D0
 
     def test_decimal_conversion(self) -> None:
         balance = CashBalance(
@@ -116,11 +122,16 @@ class TestCashBalance:
             deposits="2000",
             withdrawals=500,
         )
-        assert isinstance(balance.starting_cash, Decimal)
-        assert isinstance(balance.ending_cash, Decimal)
-        assert isinstance(balance.ending_settled_cash, Decimal)
-        assert isinstance(balance.deposits, Decimal)
-        assert isinstance(balance.withdrawals, Decimal)
+        assert all(
+            isinstance(getattr(balance, field), Decimal)
+            for field in (
+                "starting_cash",
+                "ending_cash",
+                "ending_settled_cash",
+                "deposits",
+                "withdrawals",
+            )
+        )
 
     def test_net_change(self, sample_cash_balance: CashBalance) -> None:
         # 11000 - 10000 = 1000
@@ -149,19 +160,14 @@ class TestAccount:
         assert sample_account.to_date == date(2025, 6, 30)
         assert sample_account.base_currency == "USD"
 
-    def test_default_fields(self) -> None:
-        account = Account(
-            account_id="U1234567",
-            from_date=date(2025, 1, 1),
-            to_date=date(2025, 6, 30),
-        )
-        assert account.account_alias is None
-        assert account.account_type is None
-        assert account.ib_entity is None
-        assert account.cash_balances == []
-        assert account.positions == []
-        assert account.trades == []
-        assert account.base_currency == "USD"
+    def test_default_fields(self, empty_account: Account) -> None:
+        assert empty_account.account_alias is None
+        assert empty_account.account_type is None
+        assert empty_account.ib_entity is None
+        assert empty_account.cash_balances == []
+        assert empty_account.positions == []
+        assert empty_account.trades == []
+        assert empty_account.base_currency == "USD"
 
     def test_total_cash(self, sample_account: Account) -> None:
         assert sample_account.total_cash == Decimal("11000.00")
@@ -188,20 +194,21 @@ class TestAccount:
     def test_position_count(self, sample_account: Account) -> None:
         assert sample_account.position_count == 1
 
-    def test_empty_account(self) -> None:
-        account = Account(
-            account_id="U1234567",
-            from_date=date(2025, 1, 1),
-            to_date=date(2025, 6, 30),
-        )
-        assert account.total_cash == Decimal("0")
-        assert account.total_position_value == Decimal("0")
-        assert account.total_value == Decimal("0")
-        assert account.total_unrealized_pnl == Decimal("0")
-        assert account.total_realized_pnl == Decimal("0")
-        assert account.total_commissions == Decimal("0")
-        assert account.trade_count == 0
-        assert account.position_count == 0
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("total_cash", _D0),
+            ("total_position_value", _D0),
+            ("total_value", _D0),
+            ("total_unrealized_pnl", _D0),
+            ("total_realized_pnl", _D0),
+            ("total_commissions", _D0),
+            ("trade_count", 0),
+            ("position_count", 0),
+        ],
+    )
+    def test_empty_account(self, empty_account: Account, attr: str, expected: object) -> None:
+        assert getattr(empty_account, attr) == expected
 
 
 class TestAccountMethods:
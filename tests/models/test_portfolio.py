@@ -10,30 +10,37 @@ from ib_sec_mcp.models.portfolio import Portfolio
 from ib_sec_mcp.models.position import Position
 from ib_sec_mcp.models.trade import AssetClass, BuySell, Trade
 
+# Shared Decimal literals
+_D0 = Decimal("0")
+_D100 = Decimal("100.00")
+_DNEG1 = Decimal("-1.00")
+
 
 def _make_position(
     account_id: str, symbol: str, quantity: Decimal, value: Decimal, pnl: Decimal
 ) -> Position:
-    """Helper to create a Position."""
-    return Position(
+    """Helper to create a Position.
+
+    Uses ``model_construct`` to skip validation: every input is a trusted Decimal/enum
+    literal, and omitted fields still receive their declared defaults.
+    """
+    return Position.model_construct(
         account_id=account_id,
         symbol=symbol,
         asset_class=AssetClass.STOCK,
         quantity=quantity,
-        mark_price=value / quantity if quantity else Decimal("0"),
+        mark_price=value / quantity if quantity else _D0,
         position_value=value,
-        average_cost=Decimal("100.00"),
-        cost_basis=Decimal("100.00") * quantity,
+        average_cost=_D100,
+        cost_basis=_D100 * quantity,
         unrealized_pnl=pnl,
         position_date=date(2025, 6, 30),
     )
 
 
-def _make_trade(
-    account_id: str, symbol: str, pnl: Decimal, commission: Decimal = Decimal("-1.00")
-) -> Trade:
-    """Helper to create a Trade."""
-    return Trade(
+def _make_trade(account_id: str, symbol: str, pnl: Decimal, commission: Decimal = _DNEG1) -> Trade:
+    """Helper to create a Trade (unvalidated, see ``_make_position``)."""
+    return Trade.model_construct(
         account_id=account_id,
         trade_id=f"T-{account_id}-{symbol}",
         trade_date=date(2025, 3, 15),
@@ -41,16 +48,20 @@ def _make_trade(
         asset_class=AssetClass.STOCK,
         buy_sell=BuySell.BUY,
         quantity=Decimal("10"),
-        trade_price=Decimal("100.00"),
+        trade_price=_D100,
         trade_money=Decimal("-1000.00"),
         ib_commission=commission,
         fifo_pnl_realized=pnl,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def two_account_portfolio() -> Portfolio:
-    """Create a portfolio with two accounts."""
+    """Create a portfolio with two accounts.
+
+    Module-scoped and shared by every test, so treat it as read-only; use
+    ``two_account_portfolio.model_copy(deep=True)`` in a test that needs to mutate it.
+    """
     account1 = Account(
         account_id="U1111111",
         from_date=date(2025, 1, 1),
@@ -149,19 +160,17 @@ class TestPortfolioProperties:
         # 3 trades * 1.00 = 3.00
         assert two_account_portfolio.total_commissions == Decimal("3.00")
 
-    def test_total_trades(self, two_account_portfolio: Portfolio) -> None:
-        assert two_account_portfolio.total_trades == 3
-
-    def test_total_positions(self, two_account_portfolio: Portfolio) -> None:
-        assert two_account_portfolio.total_positions == 3
-
-    def test_all_trades(self, two_account_portfolio: Portfolio) -> None:
-        trades = two_account_portfolio.all_trades
-        assert len(trades) == 3
-
-    def test_all_positions(self, two_account_portfolio: Portfolio) -> None:
-        positions = two_account_portfolio.all_positions
-        assert len(positions) == 3
+    @pytest.mark.parametrize(
+        ("count_attr", "list_attr"),
+        [("total_trades", "all_trades"), ("total_positions", "all_positions")],
+        ids=["trades", "positions"],
+    )
+    def test_totals_match_flattened_lists(
+        self, two_account_portfolio: Portfolio, count_attr: str, list_attr: str
+    ) -> None:
+        # 3 trades and 3 positions across both accounts
+        assert getattr(two_account_portfolio, count_attr) == 3
+        assert len(getattr(two_account_portfolio, list_attr)) == 3
 
 
 class TestPortfolioMethods:
@@ -200,7 +209,8 @@ class TestPortfolioMethods:
 
     def test_get_symbols(self, two_account_portfolio: Portfolio) -> None:
         symbols = two_account_portfolio.get_symbols()
-        assert sorted(symbols) == ["AAPL", "TSLA"]
+        assert set(symbols) == {"AAPL", "TSLA"}
+        assert len(symbols) == 2
 
     def test_aggregate_positions_by_symbol(self, two_account_portfolio: Portfolio) -> None:
         aggregated = two_account_portfolio.aggregate_positions_by_symbol()
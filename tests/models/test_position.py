@@ -1,44 +1,106 @@
 """Tests for Position model"""
 
+from collections.abc import Mapping
 from datetime import date
 from decimal import Decimal
+from types import MappingProxyType
+from typing import Any
+
+import pytest
 
 from ib_sec_mcp.models.position import Position
 from ib_sec_mcp.models.trade import AssetClass
 
+# Shared Decimal and date literals
+_D0 = Decimal("0")
+_Q100 = Decimal("100")
+_PX150 = Decimal("150.00")
+_MV15000 = Decimal("15000.00")
+_AVG120 = Decimal("120.00")
+_COST12000 = Decimal("12000.00")
+_PNL3000 = Decimal("3000.00")
+_DATE = date(2025, 6, 30)
+
+# Baseline long stock position (read-only); tests override only the fields they exercise
+_BASE_POS: Mapping[str, Any] = MappingProxyType(
+    {
+        "account_id": "U1234567",
+        "symbol": "AAPL",
+        "asset_class": AssetClass.STOCK,
+        "quantity": _Q100,
+        "mark_price": _PX150,
+        "position_value": _MV15000,
+        "average_cost": _AVG120,
+        "cost_basis": _COST12000,
+        "position_date": _DATE,
+    }
+)
+
+_BOND_OVERRIDES: Mapping[str, Any] = MappingProxyType(
+    {
+        "symbol": "US912810TD00",
+        "asset_class": AssetClass.BOND,
+        "quantity": Decimal("10000"),
+        "mark_price": Decimal("95.50"),
+        "position_value": Decimal("9550.00"),
+        "average_cost": Decimal("90.00"),
+        "cost_basis": Decimal("9000.00"),
+    }
+)
+
+_SHORT_OVERRIDES: Mapping[str, Any] = MappingProxyType(
+    {
+        "quantity": Decimal("-100"),
+        "position_value": Decimal("-15000.00"),
+        "average_cost": Decimal("160.00"),
+        "cost_basis": Decimal("-16000.00"),
+    }
+)
+
+# Property cases as (field overrides, property, expected) rows over ``_BASE_POS``
+_POSITION_CASES = [
+    pytest.param({}, "market_value", _MV15000, id="market_value"),
+    pytest.param(
+        {"unrealized_pnl": _PNL3000, "realized_pnl": Decimal("500.00")},
+        "total_pnl",
+        Decimal("3500.00"),
+        id="total_pnl",
+    ),
+    # 3000 / 12000 * 100 = 25%
+    pytest.param({"unrealized_pnl": _PNL3000}, "pnl_percentage", Decimal("25"), id="pnl_pct"),
+    pytest.param(
+        {"average_cost": _D0, "cost_basis": _D0, "unrealized_pnl": _PNL3000},
+        "pnl_percentage",
+        _D0,
+        id="pnl_pct_zero_cost_basis",
+    ),
+    pytest.param({}, "is_long", True, id="long_is_long"),
+    pytest.param({}, "is_short", False, id="long_is_not_short"),
+    pytest.param(_SHORT_OVERRIDES, "is_short", True, id="short_is_short"),
+    pytest.param(_SHORT_OVERRIDES, "is_long", False, id="short_is_not_long"),
+    pytest.param({}, "is_bond", False, id="stock_is_not_bond"),
+    pytest.param(_BOND_OVERRIDES, "is_bond", True, id="bond_is_bond"),
+]
+
+
+def _pos(**overrides: Any) -> Position:
+    """Validate ``_BASE_POS`` with the given field overrides into a Position."""
+    return Position.model_validate({**_BASE_POS, **overrides})
+
 
 class TestPositionCreation:
     """Tests for Position model creation"""
 
     def test_stock_position(self) -> None:
-        position = Position(
-            account_id="U1234567",
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            quantity=Decimal("100"),
-            mark_price=Decimal("150.00"),
-            position_value=Decimal("15000.00"),
-            average_cost=Decimal("120.00"),
-            cost_basis=Decimal("12000.00"),
-            unrealized_pnl=Decimal("3000.00"),
-            position_date=date(2025, 6, 30),
-        )
+        position = _pos(unrealized_pnl=_PNL3000)
         assert position.symbol == "AAPL"
         assert position.asset_class == AssetClass.STOCK
-        assert position.quantity == Decimal("100")
+        assert position.quantity == _Q100
 
     def test_bond_position(self) -> None:
-        position = Position(
-            account_id="U1234567",
-            symbol="US912810TD00",
-            asset_class=AssetClass.BOND,
-            quantity=Decimal("10000"),
-            mark_price=Decimal("95.50"),
-            position_value=Decimal("9550.00"),
-            average_cost=Decimal("90.00"),
-            cost_basis=Decimal("9000.00"),
+        position = _pos(
+            **_BOND_OVERRIDES,
             unrealized_pnl=Decimal("550.00"),
-            position_date=date(2025, 6, 30),
             coupon_rate=Decimal("4.5"),
             maturity_date=date(2030, 12, 31),
         )
@@ -47,19 +109,9 @@ class TestPositionCreation:
         assert position.maturity_date == date(2030, 12, 31)
 
     def test_default_fields(self) -> None:
-        position = Position(
-            account_id="U1234567",
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            quantity=Decimal("100"),
-            mark_price=Decimal("150.00"),
-            position_value=Decimal("15000.00"),
-            average_cost=Decimal("120.00"),
-            cost_basis=Decimal("12000.00"),
-            position_date=date(2025, 6, 30),
-        )
-        assert position.unrealized_pnl == Decimal("0")
-        assert position.realized_pnl == Decimal("0")
+        position = _pos()
+        assert position.unrealized_pnl == _D0
+        assert position.realized_pnl == _D0
         assert position.currency == "USD"
         assert position.fx_rate_to_base == Decimal("1.0")
         assert position.multiplier == Decimal("1")
@@ -75,155 +127,29 @@ class TestPositionCreation:
 class TestPositionDecimalConversion:
     """Tests for field_validator decimal conversion"""
 
-    def test_int_conversion(self) -> None:
-        position = Position(
-            account_id="U1234567",
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            quantity=100,
-            mark_price=150,
-            position_value=15000,
-            average_cost=Decimal("120.00"),
-            cost_basis=Decimal("12000.00"),
-            position_date=date(2025, 6, 30),
-        )
-        assert isinstance(position.quantity, Decimal)
-        assert isinstance(position.mark_price, Decimal)
-        assert isinstance(position.position_value, Decimal)
-
-    def test_str_conversion(self) -> None:
-        position = Position(
-            account_id="U1234567",
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            quantity="100",
-            mark_price="150.50",
-            position_value="15050.00",
-            average_cost=Decimal("120.00"),
-            cost_basis=Decimal("12000.00"),
-            position_date=date(2025, 6, 30),
-        )
-        assert position.quantity == Decimal("100")
-        assert position.mark_price == Decimal("150.50")
-        assert position.position_value == Decimal("15050.00")
+    @pytest.mark.parametrize(
+        ("quantity", "mark_price", "position_value"),
+        [
+            pytest.param(100, 150, 15000, id="int"),
+            pytest.param("100", "150.50", "15050.00", id="str"),
+            pytest.param(_Q100, _PX150, _MV15000, id="decimal"),
+        ],
+    )
+    def test_decimal_coercion(
+        self, quantity: object, mark_price: object, position_value: object
+    ) -> None:
+        position = _pos(quantity=quantity, mark_price=mark_price, position_value=position_value)
+        assert type(position.quantity) is Decimal
+        assert position.quantity == Decimal(str(quantity))
+        assert position.mark_price == Decimal(str(mark_price))
+        assert position.position_value == Decimal(str(position_value))
 
 
 class TestPositionProperties:
     """Tests for Position computed properties"""
 
-    def test_market_value(self) -> None:
-        position = Position(
-            account_id="U1234567",
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            quantity=Decimal("100"),
-            mark_price=Decimal("150.00"),
-            position_value=Decimal("15000.00"),
-            average_cost=Decimal("120.00"),
-            cost_basis=Decimal("12000.00"),
-            position_date=date(2025, 6, 30),
-        )
-        assert position.market_value == Decimal("15000.00")
-
-    def test_total_pnl(self) -> None:
-        position = Position(
-            account_id="U1234567",
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            quantity=Decimal("100"),
-            mark_price=Decimal("150.00"),
-            position_value=Decimal("15000.00"),
-            average_cost=Decimal("120.00"),
-            cost_basis=Decimal("12000.00"),
-            unrealized_pnl=Decimal("3000.00"),
-            realized_pnl=Decimal("500.00"),
-            position_date=date(2025, 6, 30),
-        )
-        assert position.total_pnl == Decimal("3500.00")
-
-    def test_pnl_percentage(self) -> None:
-        position = Position(
-            account_id="U1234567",
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            quantity=Decimal("100"),
-            mark_price=Decimal("150.00"),
-            position_value=Decimal("15000.00"),
-            average_cost=Decimal("120.00"),
-            cost_basis=Decimal("12000.00"),
-            unrealized_pnl=Decimal("3000.00"),
-            position_date=date(2025, 6, 30),
-        )
-        # 3000 / 12000 * 100 = 25%
-        assert position.pnl_percentage == Decimal("25")
-
-    def test_pnl_percentage_zero_cost_basis(self) -> None:
-        position = Position(
-            account_id="U1234567",
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            quantity=Decimal("100"),
-            mark_price=Decimal("150.00"),
-            position_value=Decimal("15000.00"),
-            average_cost=Decimal("0"),
-            cost_basis=Decimal("0"),
-            unrealized_pnl=Decimal("3000.00"),
-            position_date=date(2025, 6, 30),
-        )
-        assert position.pnl_percentage == Decimal("0")
-
-    def test_is_long(self) -> None:
-        position = Position(
-            account_id="U1234567",
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            quantity=Decimal("100"),
-            mark_price=Decimal("150.00"),
-            position_value=Decimal("15000.00"),
-            average_cost=Decimal("120.00"),
-            cost_basis=Decimal("12000.00"),
-            position_date=date(2025, 6, 30),
-        )
-        assert position.is_long is True
-        assert position.is_short is False
-
-    def test_is_short(self) -> None:
-        position = Position(
-            account_id="U1234567",
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            quantity=Decimal("-100"),
-            mark_price=Decimal("150.00"),
-            position_value=Decimal("-15000.00"),
-            average_cost=Decimal("160.00"),
-            cost_basis=Decimal("-16000.00"),
-            position_date=date(2025, 6, 30),
-        )
-        assert position.is_short is True
-        assert position.is_long is False
-
-    def test_is_bond(self) -> None:
-        stock = Position(
-            account_id="U1234567",
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            quantity=Decimal("100"),
-            mark_price=Decimal("150.00"),
-            position_value=Decimal("15000.00"),
-            average_cost=Decimal("120.00"),
-            cost_basis=Decimal("12000.00"),
-            position_date=date(2025, 6, 30),
-        )
-        bond = Position(
-            account_id="U1234567",
-            symbol="US912810TD00",
-            asset_class=AssetClass.BOND,
-            quantity=Decimal("10000"),
-            mark_price=Decimal("95.50"),
-            position_value=Decimal("9550.00"),
-            average_cost=Decimal("90.00"),
-            cost_basis=Decimal("9000.00"),
-            position_date=date(2025, 6, 30),
-        )
-        assert stock.is_bond is False
-        assert bond.is_bond is True
+    @pytest.mark.parametrize(("overrides", "attr", "expected"), _POSITION_CASES)
+    def test_property(self, overrides: Mapping[str, Any], attr: str, expected: object) -> None:
+        # Case rows are trusted literals, so validation is skipped
+        position = Position.model_construct(**{**_BASE_POS, **overrides})
+        assert getattr(position, attr) == expected
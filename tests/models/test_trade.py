@@ -1,13 +1,96 @@
 """Tests for Trade model, BuySell enum, and AssetClass enum"""
 
+from collections.abc import Mapping
 from datetime import date, datetime
 from decimal import Decimal
+from types import MappingProxyType
+from typing import Any
 
 import pytest
 from pydantic import ValidationError
 
 from ib_sec_mcp.models.trade import AssetClass, BuySell, Trade
 
+# Shared Decimal and date literals
+_D0 = Decimal("0")
+_Q100 = Decimal("100")
+_PX150 = Decimal("150.00")
+_BUY_MONEY = Decimal("-15000.00")
+_TRADE_DATE = date(2025, 1, 15)
+
+# Minimal valid buy trade
+_BASE_TRADE: Mapping[str, Any] = MappingProxyType(
+    {
+        "account_id": "U1234567",
+        "trade_id": "T001",
+        "trade_date": _TRADE_DATE,
+        "symbol": "AAPL",
+        "asset_class": AssetClass.STOCK,
+        "buy_sell": BuySell.BUY,
+        "quantity": _Q100,
+        "trade_price": _PX150,
+        "trade_money": _BUY_MONEY,
+    }
+)
+
+# Buy of 100 @ 150.50 with a 1.50 commission
+_COMMISSIONED_BUY: Mapping[str, Any] = MappingProxyType(
+    {
+        "trade_price": Decimal("150.50"),
+        "trade_money": Decimal("-15050.00"),
+        "ib_commission": Decimal("-1.50"),
+    }
+)
+
+_SELL: Mapping[str, Any] = MappingProxyType(
+    {
+        "trade_id": "T002",
+        "trade_date": date(2025, 1, 20),
+        "buy_sell": BuySell.SELL,
+        "trade_price": Decimal("160.00"),
+        "trade_money": Decimal("16000.00"),
+    }
+)
+
+_TRADE_CASES = [
+    pytest.param(_COMMISSIONED_BUY, "gross_amount", Decimal("15050.00"), id="gross_amount"),
+    # gross_amount (15050) - abs(commission) (1.50)
+    pytest.param(_COMMISSIONED_BUY, "net_amount", Decimal("15048.50"), id="net_amount"),
+    pytest.param({}, "is_buy", True, id="buy_is_buy"),
+    pytest.param({}, "is_sell", False, id="buy_is_not_sell"),
+    pytest.param(_SELL, "is_sell", True, id="sell_is_sell"),
+    pytest.param(_SELL, "is_buy", False, id="sell_is_not_buy"),
+    # abs(1.50) / 15050.00 * 100
+    pytest.param(
+        _COMMISSIONED_BUY,
+        "commission_rate",
+        Decimal("1.50") / Decimal("15050.00") * 100,
+        id="commission_rate",
+    ),
+    pytest.param({"trade_money": _D0}, "commission_rate", _D0, id="commission_rate_zero_gross"),
+]
+
+
+# Invalid inputs as (exception, match, constructor, kwargs); one parametrized negative test
+_INVALID_CASES = [
+    pytest.param(
+        ValidationError,
+        "trade_date",
+        Trade,
+        {k: v for k, v in _BASE_TRADE.items() if k != "trade_date"},
+        id="trade_missing_trade_date",
+    ),
+    pytest.param(ValueError, "'HOLD'", BuySell, {"value": "HOLD"}, id="buy_sell_invalid"),
+    pytest.param(
+        ValueError, "'INVALID'", AssetClass, {"value": "INVALID"}, id="asset_class_invalid"
+    ),
+]
+
+
+def _trade(**overrides: Any) -> Trade:
+    """``_BASE_TRADE`` with the given fields replaced, validated into a Trade."""
+    return Trade.model_validate({**_BASE_TRADE, **overrides})
+
 
 class TestBuySell:
     """Tests for BuySell enum"""
@@ -24,10 +107,6 @@ class TestBuySell:
         assert BuySell("BUY") is BuySell.BUY
         assert BuySell("SELL") is BuySell.SELL
 
-    def test_invalid_value(self) -> None:
-        with pytest.raises(ValueError):
-            BuySell("HOLD")
-
 
 class TestAssetClass:
     """Tests for AssetClass enum"""
@@ -45,24 +124,23 @@ class TestAssetClass:
         assert AssetClass("STK") is AssetClass.STOCK
         assert AssetClass("BOND") is AssetClass.BOND
 
-    def test_invalid_value(self) -> None:
-        with pytest.raises(ValueError):
-            AssetClass("INVALID")
 
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_trade() -> Trade:
-    """Create a sample trade for testing."""
+    """Create a sample trade for testing.
+
+    Module-scoped and shared by every consumer, so tests must treat it as read-only.
+    """
     return Trade(
         account_id="U1234567",
         trade_id="T001",
-        trade_date=date(2025, 1, 15),
+        trade_date=_TRADE_DATE,
         settle_date=date(2025, 1, 17),
         symbol="AAPL",
         description="APPLE INC",
         asset_class=AssetClass.STOCK,
         buy_sell=BuySell.BUY,
-        quantity=Decimal("100"),
+        quantity=_Q100,
         trade_price=Decimal("150.50"),
         trade_money=Decimal("-15050.00"),
         currency="USD",
@@ -79,23 +157,13 @@ class TestTradeCreation:
     def test_required_fields(self, sample_trade: Trade) -> None:
         assert sample_trade.account_id == "U1234567"
         assert sample_trade.trade_id == "T001"
-        assert sample_trade.trade_date == date(2025, 1, 15)
+        assert sample_trade.trade_date == _TRADE_DATE
         assert sample_trade.symbol == "AAPL"
         assert sample_trade.asset_class == AssetClass.STOCK
         assert sample_trade.buy_sell == BuySell.BUY
 
     def test_optional_fields_default_none(self) -> None:
-        trade = Trade(
-            account_id="U1234567",
-            trade_id="T001",
-            trade_date=date(2025, 1, 15),
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            buy_sell=BuySell.BUY,
-            quantity=Decimal("100"),
-            trade_price=Decimal("150.00"),
-            trade_money=Decimal("-15000.00"),
-        )
+        trade = _trade()
         assert trade.settle_date is None
         assert trade.open_date is None
         assert trade.description is None
@@ -107,166 +175,61 @@ class TestTradeCreation:
         assert trade.notes is None
 
     def test_open_date_field(self) -> None:
-        trade = Trade(
-            account_id="U1234567",
-            trade_id="T001",
-            trade_date=date(2025, 1, 15),
+        trade = _trade(
             settle_date=date(2025, 1, 17),
             open_date=date(2024, 6, 1),
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
             buy_sell=BuySell.SELL,
-            quantity=Decimal("100"),
             trade_price=Decimal("160.00"),
             trade_money=Decimal("16000.00"),
         )
         assert trade.open_date == date(2024, 6, 1)
 
     def test_default_decimal_fields(self) -> None:
-        trade = Trade(
-            account_id="U1234567",
-            trade_id="T001",
-            trade_date=date(2025, 1, 15),
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            buy_sell=BuySell.BUY,
-            quantity=Decimal("100"),
-            trade_price=Decimal("150.00"),
-            trade_money=Decimal("-15000.00"),
-        )
+        trade = _trade()
         assert trade.fx_rate_to_base == Decimal("1.0")
-        assert trade.ib_commission == Decimal("0")
-        assert trade.fifo_pnl_realized == Decimal("0")
-        assert trade.mtm_pnl == Decimal("0")
-
-    def test_missing_required_field_raises(self) -> None:
-        with pytest.raises(ValidationError):
-            Trade(
-                account_id="U1234567",
-                trade_id="T001",
-                # missing trade_date
-                symbol="AAPL",
-                asset_class=AssetClass.STOCK,
-                buy_sell=BuySell.BUY,
-                quantity=Decimal("100"),
-                trade_price=Decimal("150.00"),
-                trade_money=Decimal("-15000.00"),
-            )
+        assert trade.ib_commission == _D0
+        assert trade.fifo_pnl_realized == _D0
+        assert trade.mtm_pnl == _D0
 
     def test_order_time_datetime(self) -> None:
         order_time = datetime(2025, 1, 15, 10, 30, 0)
-        trade = Trade(
-            account_id="U1234567",
-            trade_id="T001",
-            trade_date=date(2025, 1, 15),
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            buy_sell=BuySell.BUY,
-            quantity=Decimal("100"),
-            trade_price=Decimal("150.00"),
-            trade_money=Decimal("-15000.00"),
-            order_time=order_time,
-        )
+        trade = _trade(order_time=order_time)
         assert trade.order_time == order_time
 
 
 class TestTradeDecimalConversion:
     """Tests for field_validator decimal conversion"""
 
-    def test_int_to_decimal(self) -> None:
-        trade = Trade(
-            account_id="U1234567",
-            trade_id="T001",
-            trade_date=date(2025, 1, 15),
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            buy_sell=BuySell.BUY,
-            quantity=100,
-            trade_price=150,
-            trade_money=Decimal("-15000.00"),
-        )
-        assert isinstance(trade.quantity, Decimal)
-        assert trade.quantity == Decimal("100")
-        assert isinstance(trade.trade_price, Decimal)
-        assert trade.trade_price == Decimal("150")
-
-    def test_float_to_decimal(self) -> None:
-        trade = Trade(
-            account_id="U1234567",
-            trade_id="T001",
-            trade_date=date(2025, 1, 15),
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            buy_sell=BuySell.BUY,
-            quantity=100.5,
-            trade_price=150.25,
-            trade_money=Decimal("-15000.00"),
-        )
-        assert isinstance(trade.quantity, Decimal)
-        assert isinstance(trade.trade_price, Decimal)
-
-    def test_str_to_decimal(self) -> None:
-        trade = Trade(
-            account_id="U1234567",
-            trade_id="T001",
-            trade_date=date(2025, 1, 15),
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            buy_sell=BuySell.BUY,
-            quantity="100",
-            trade_price="150.50",
-            trade_money=Decimal("-15000.00"),
-        )
-        assert isinstance(trade.quantity, Decimal)
-        assert trade.quantity == Decimal("100")
-        assert isinstance(trade.trade_price, Decimal)
-        assert trade.trade_price == Decimal("150.50")
+    @pytest.mark.parametrize(
+        ("quantity", "trade_price"),
+        [
+            pytest.param(100, 150, id="int"),
+            pytest.param(100.5, 150.25, id="float"),
+            pytest.param("100", "150.50", id="str"),
+        ],
+    )
+    def test_decimal_coercion(self, quantity: object, trade_price: object) -> None:
+        trade = _trade(quantity=quantity, trade_price=trade_price)
+        assert type(trade.quantity) is Decimal
+        assert trade.quantity == Decimal(str(quantity))
+        assert trade.trade_price == Decimal(str(trade_price))
 
 
 class TestTradeProperties:
     """Tests for Trade computed properties"""
 
-    def test_gross_amount(self, sample_trade: Trade) -> None:
-        assert sample_trade.gross_amount == Decimal("15050.00")
+    @pytest.mark.parametrize(("overrides", "attr", "expected"), _TRADE_CASES)
+    def test_property(self, overrides: Mapping[str, Any], attr: str, expected: object) -> None:
+        trade = Trade.model_construct(**{**_BASE_TRADE, **overrides})
+        assert getattr(trade, attr) == expected
 
-    def test_net_amount(self, sample_trade: Trade) -> None:
-        # gross_amount (15050) - abs(commission) (1.50)
-        assert sample_trade.net_amount == Decimal("15048.50")
 
-    def test_is_buy(self, sample_trade: Trade) -> None:
-        assert sample_trade.is_buy is True
-        assert sample_trade.is_sell is False
+class TestInvalidInput:
+    """Invalid enum values and missing required fields are rejected"""
 
-    def test_is_sell(self) -> None:
-        trade = Trade(
-            account_id="U1234567",
-            trade_id="T002",
-            trade_date=date(2025, 1, 20),
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            buy_sell=BuySell.SELL,
-            quantity=Decimal("100"),
-            trade_price=Decimal("160.00"),
-            trade_money=Decimal("16000.00"),
-        )
-        assert trade.is_sell is True
-        assert trade.is_buy is False
-
-    def test_commission_rate(self, sample_trade: Trade) -> None:
-        # abs(1.50) / 15050.00 * 100
-        expected = Decimal("1.50") / Decimal("15050.00") * 100
-        assert sample_trade.commission_rate == expected
-
-    def test_commission_rate_zero_gross(self) -> None:
-        trade = Trade(
-            account_id="U1234567",
-            trade_id="T001",
-            trade_date=date(2025, 1, 15),
-            symbol="AAPL",
-            asset_class=AssetClass.STOCK,
-            buy_sell=BuySell.BUY,
-            quantity=Decimal("100"),
-            trade_price=Decimal("150.00"),
-            trade_money=Decimal("0"),
-        )
-        assert trade.commission_rate == Decimal("0")
+    @pytest.mark.parametrize(("exc", "match", "ctor", "kwargs"), _INVALID_CASES)
+    def test_rejects_invalid(
+        self, exc: type[Exception], match: str, ctor: Any, kwargs: dict[str, Any]
+    ) -> None:
+        with pytest.raises(exc, match=match):
+            ctor(**kwargs)
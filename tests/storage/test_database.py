@@ -1,30 +1,64 @@
 """Tests for DatabaseConnection and schema migrations"""
 
+from decimal import Decimal
 from pathlib import Path
 
 import pytest
 
-from ib_sec_mcp.storage.database import DatabaseConnection
+from ib_sec_mcp.storage.database import IN_MEMORY_DB, DatabaseConnection
 from ib_sec_mcp.storage.migrations import create_schema, drop_schema, verify_schema
 
+_EXECUTEMANY_PARAMS = [(0, "val0"), (1, "val1"), (2, "val2"), (3, "val3"), (4, "val4")]
+
 # ---------------------------------------------------------------------------
 # Fixtures
+#
+# Fixtures use an in-memory database; only tests of the on-disk contract
+# (directory creation, context manager) open a file under tmp_path.
 # ---------------------------------------------------------------------------
 
 
 @pytest.fixture
-def db(tmp_path: Path) -> DatabaseConnection:
-    db = DatabaseConnection(tmp_path / "test.db")
-    yield db
-    db.close()
+def db() -> DatabaseConnection:
+    with DatabaseConnection(IN_MEMORY_DB) as db:
+        yield db
+
+
+@pytest.fixture(scope="module")
+def shared_db_connection() -> DatabaseConnection:
+    with DatabaseConnection(IN_MEMORY_DB) as db:
+        yield db
 
 
 @pytest.fixture
-def db_with_schema(tmp_path: Path) -> DatabaseConnection:
-    db = DatabaseConnection(tmp_path / "test.db")
-    create_schema(db)
-    yield db
-    db.close()
+def db_with_table(shared_db_connection: DatabaseConnection) -> DatabaseConnection:
+    """Module-wide connection with an empty scratch table ``t (id, val)``.
+
+    The table is created for each test and dropped afterwards.
+    """
+    shared_db_connection.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, val TEXT)")
+    yield shared_db_connection
+    shared_db_connection.execute("DROP TABLE t")
+
+
+@pytest.fixture(scope="module")
+def built_schema() -> DatabaseConnection:
+    """Schema built once and shared by the tests that only inspect it."""
+    with DatabaseConnection(IN_MEMORY_DB) as db:
+        create_schema(db)
+        yield db
+
+
+@pytest.fixture(scope="module")
+def schema_objects(built_schema: DatabaseConnection) -> dict[str, set[str]]:
+    """Table and index names from a single sqlite_master scan, keyed by type."""
+    objects: dict[str, set[str]] = {"table": set(), "index": set()}
+    for row in built_schema.fetchall(
+        "SELECT type, name FROM sqlite_master "
+        "WHERE type IN ('table', 'index') AND name NOT LIKE 'sqlite_%'"
+    ):
+        objects[row["type"]].add(row["name"])
+    return objects
 
 
 # ---------------------------------------------------------------------------
@@ -39,61 +73,96 @@ class TestDatabaseConnection:
         assert nested.exists()
         db.close()
 
-    def test_execute_and_fetchone(self, db: DatabaseConnection) -> None:
-        db.execute("CREATE TABLE t (id INTEGER, val TEXT)")
-        db.execute("INSERT INTO t VALUES (?, ?)", (1, "hello"))
-        row = db.fetchone("SELECT * FROM t WHERE id = ?", (1,))
+    def test_file_database_uses_wal(self, tmp_path: Path) -> None:
+        with DatabaseConnection(tmp_path / "wal.db") as db:
+            journal = db.fetchone("PRAGMA journal_mode")
+            sync = db.fetchone("PRAGMA synchronous")
+        assert journal is not None
+        assert journal["journal_mode"] == "wal"
+        assert sync is not None
+        assert sync["synchronous"] == 1  # NORMAL
+
+    def test_in_memory_creates_no_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        with DatabaseConnection(IN_MEMORY_DB) as db:
+            db.execute("CREATE TABLE t (id INTEGER)")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_execute_and_fetchone(self, db_with_table: DatabaseConnection) -> None:
+        db_with_table.execute("INSERT INTO t VALUES (?, ?)", (1, "hello"))
+        row = db_with_table.fetchone("SELECT * FROM t WHERE id = ?", (1,))
         assert row is not None
         assert row["id"] == 1
         assert row["val"] == "hello"
 
-    def test_execute_and_fetchall(self, db: DatabaseConnection) -> None:
-        db.execute("CREATE TABLE t (id INTEGER, val TEXT)")
-        db.execute("INSERT INTO t VALUES (?, ?)", (1, "a"))
-        db.execute("INSERT INTO t VALUES (?, ?)", (2, "b"))
-        rows = db.fetchall("SELECT * FROM t ORDER BY id")
+    def test_execute_and_fetchall(self, db_with_table: DatabaseConnection) -> None:
+        db_with_table.execute("INSERT INTO t VALUES (?, ?)", (1, "a"))
+        db_with_table.execute("INSERT INTO t VALUES (?, ?)", (2, "b"))
+        rows = db_with_table.fetchall("SELECT * FROM t ORDER BY id")
         assert len(rows) == 2
         assert rows[0]["val"] == "a"
         assert rows[1]["val"] == "b"
 
-    def test_executemany(self, db: DatabaseConnection) -> None:
-        db.execute("CREATE TABLE t (id INTEGER, val TEXT)")
-        params = [(i, f"val{i}") for i in range(5)]
-        db.executemany("INSERT INTO t VALUES (?, ?)", params)
-        rows = db.fetchall("SELECT * FROM t")
-        assert len(rows) == 5
+    def test_executemany(self, db_with_table: DatabaseConnection) -> None:
+        db_with_table.executemany("INSERT INTO t VALUES (?, ?)", _EXECUTEMANY_PARAMS)
+        rows = db_with_table.fetchall("SELECT * FROM t")
+        assert len(rows) == len(_EXECUTEMANY_PARAMS)
+
+    def test_execute_multi_row_values(self, db_with_table: DatabaseConnection) -> None:
+        params = [(1, "a"), (2, "b"), (3, "c")]
+        placeholders = ", ".join(["(?, ?)"] * len(params))
+        flat = tuple(value for row in params for value in row)
+        db_with_table.execute(f"INSERT INTO t VALUES {placeholders}", flat)
+        rows = db_with_table.fetchall("SELECT * FROM t ORDER BY id")
+        assert [(row["id"], row["val"]) for row in rows] == params
+
+    def test_executemany_batch_in_transaction(self, db_with_table: DatabaseConnection) -> None:
+        params = [(i, str(i)) for i in range(1000)]
+        with db_with_table.transaction() as conn:
+            conn.executemany("INSERT INTO t VALUES (?, ?)", params)
+        row = db_with_table.fetchone("SELECT COUNT(*) AS n FROM t")
+        assert row is not None
+        assert row["n"] == 1000
 
-    def test_fetchone_returns_none_for_empty(self, db: DatabaseConnection) -> None:
-        db.execute("CREATE TABLE t (id INTEGER)")
-        result = db.fetchone("SELECT * FROM t WHERE id = ?", (999,))
+    def test_fetchone_returns_none_for_empty(self, db_with_table: DatabaseConnection) -> None:
+        result = db_with_table.fetchone("SELECT * FROM t WHERE id = ?", (999,))
         assert result is None
 
-    def test_fetchall_returns_empty_list(self, db: DatabaseConnection) -> None:
-        db.execute("CREATE TABLE t (id INTEGER)")
-        result = db.fetchall("SELECT * FROM t")
+    def test_fetchall_returns_empty_list(self, db_with_table: DatabaseConnection) -> None:
+        result = db_with_table.fetchall("SELECT * FROM t")
         assert result == []
 
-    def test_transaction_commits_on_success(self, db: DatabaseConnection) -> None:
-        db.execute("CREATE TABLE t (id INTEGER)")
-        with db.transaction() as conn:
-            conn.execute("INSERT INTO t VALUES (?)", (42,))
+    def test_transaction_commits_on_success(self, db_with_table: DatabaseConnection) -> None:
+        with db_with_table.transaction() as conn:
+            conn.execute("INSERT INTO t (id) VALUES (?)", (42,))
         # After transaction, data should be persisted
-        row = db.fetchone("SELECT * FROM t WHERE id = ?", (42,))
+        row = db_with_table.fetchone("SELECT * FROM t WHERE id = ?", (42,))
         assert row is not None
 
-    def test_transaction_rolls_back_on_error(self, db: DatabaseConnection) -> None:
-        db.execute("CREATE TABLE t (id INTEGER)")
-        with pytest.raises(RuntimeError), db.transaction() as conn:
-            conn.execute("INSERT INTO t VALUES (?)", (1,))
+    def test_transaction_rolls_back_on_error(self, db_with_table: DatabaseConnection) -> None:
+        with pytest.raises(RuntimeError), db_with_table.transaction() as conn:
+            conn.execute("INSERT INTO t (id) VALUES (?)", (1,))
             raise RuntimeError("deliberate failure")
         # Row should not be persisted
-        rows = db.fetchall("SELECT * FROM t")
+        rows = db_with_table.fetchall("SELECT * FROM t")
         assert rows == []
 
-    def test_cursor_context_manager(self, db: DatabaseConnection) -> None:
-        db.execute("CREATE TABLE t (id INTEGER)")
-        db.execute("INSERT INTO t VALUES (?)", (7,))
-        with db.cursor() as cur:
+    def test_nested_transaction_rolls_back_inner_only(
+        self, db_with_table: DatabaseConnection
+    ) -> None:
+        with db_with_table.transaction() as conn:
+            conn.execute("INSERT INTO t (id) VALUES (?)", (1,))
+            with pytest.raises(RuntimeError), db_with_table.transaction() as inner:
+                inner.execute("INSERT INTO t (id) VALUES (?)", (2,))
+                raise RuntimeError("deliberate failure")
+        rows = db_with_table.fetchall("SELECT id FROM t")
+        assert rows == [{"id": 1}]
+
+    def test_cursor_context_manager(self, db_with_table: DatabaseConnection) -> None:
+        db_with_table.execute("INSERT INTO t (id) VALUES (?)", (7,))
+        with db_with_table.cursor() as cur:
             cur.execute("SELECT * FROM t")
             rows = cur.fetchall()
         assert len(rows) == 1
@@ -102,19 +171,32 @@ class TestDatabaseConnection:
         db_path = tmp_path / "ctx.db"
         with DatabaseConnection(db_path) as db:
             db.execute("CREATE TABLE t (id INTEGER)")
-            db.execute("INSERT INTO t VALUES (?)", (1,))
+            db.execute("INSERT INTO t (id) VALUES (?)", (1,))
             row = db.fetchone("SELECT * FROM t")
             assert row is not None
 
-    def test_foreign_keys_enabled(self, db: DatabaseConnection) -> None:
-        result = db.fetchone("PRAGMA foreign_keys")
+    def test_decimal_round_trips_as_text(self, db_with_table: DatabaseConnection) -> None:
+        db_with_table.execute("INSERT INTO t VALUES (?, ?)", (1, Decimal("1234.56789012345")))
+        row = db_with_table.fetchone(
+            'SELECT typeof(val) AS stored, val AS "val [DECIMAL]" FROM t WHERE id = ?', (1,)
+        )
+        assert row is not None
+        assert row["stored"] == "text"
+        assert row["val"] == Decimal("1234.56789012345")
+
+    def test_explain_query_plan(self, db_with_table: DatabaseConnection) -> None:
+        plan = db_with_table.explain_query_plan("SELECT val FROM t WHERE id = ?", (1,))
+        assert len(plan) == 1
+        assert plan[0].startswith("SEARCH t USING INTEGER PRIMARY KEY")
+
+    def test_foreign_keys_enabled(self, db_with_table: DatabaseConnection) -> None:
+        result = db_with_table.fetchone("PRAGMA foreign_keys")
         assert result is not None
         assert result["foreign_keys"] == 1
 
-    def test_execute_without_params(self, db: DatabaseConnection) -> None:
-        db.execute("CREATE TABLE t (id INTEGER)")
-        db.execute("INSERT INTO t VALUES (1)")
-        rows = db.fetchall("SELECT * FROM t")
+    def test_execute_without_params(self, db_with_table: DatabaseConnection) -> None:
+        db_with_table.execute("INSERT INTO t (id) VALUES (1)")
+        rows = db_with_table.fetchall("SELECT * FROM t")
         assert len(rows) == 1
 
 
@@ -124,24 +206,19 @@ class TestDatabaseConnection:
 
 
 class TestSchemaCreation:
-    def test_create_schema_creates_tables(self, db: DatabaseConnection) -> None:
-        create_schema(db)
-        tables = db.fetchall("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
-        table_names = {row["name"] for row in tables}
-        assert "position_snapshots" in table_names
-        assert "snapshot_metadata" in table_names
-
-    def test_create_schema_creates_indexes(self, db: DatabaseConnection) -> None:
-        create_schema(db)
-        indexes = db.fetchall(
-            "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'"
-        )
-        index_names = {row["name"] for row in indexes}
-        assert "idx_account_date" in index_names
-        assert "idx_symbol_date" in index_names
-        assert "idx_date" in index_names
-        assert "idx_asset_class" in index_names
-        assert "idx_snapshot_account_date" in index_names
+    def test_create_schema_creates_tables(self, schema_objects: dict[str, set[str]]) -> None:
+        assert {"position_snapshots", "snapshot_metadata"} <= schema_objects["table"]
+
+    def test_create_schema_creates_indexes(self, schema_objects: dict[str, set[str]]) -> None:
+        assert {
+            "idx_account_date",
+            "idx_symbol_date",
+            "idx_account_symbol_date",
+            "idx_account_date_value",
+            "idx_date",
+            "idx_asset_class",
+            "idx_snapshot_account_date",
+        } <= schema_objects["index"]
 
     def test_create_schema_idempotent(self, db: DatabaseConnection) -> None:
         # Should not raise on second call
@@ -160,9 +237,8 @@ class TestSchemaCreation:
         )
         assert tables == []
 
-    def test_verify_schema_success(self, db: DatabaseConnection) -> None:
-        create_schema(db)
-        assert verify_schema(db) is True
+    def test_verify_schema_success(self, built_schema: DatabaseConnection) -> None:
+        assert verify_schema(built_schema) is True
 
     def test_verify_schema_failure_missing_table(self, db: DatabaseConnection) -> None:
         # Don't create schema — should fail
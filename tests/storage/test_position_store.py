@@ -1,5 +1,7 @@
 """Tests for PositionStore"""
 
+import functools
+import sqlite3
 from datetime import date
 from decimal import Decimal
 from pathlib import Path
@@ -9,6 +11,8 @@ import pytest
 from ib_sec_mcp.models.account import Account, CashBalance
 from ib_sec_mcp.models.position import Position
 from ib_sec_mcp.models.trade import AssetClass
+from ib_sec_mcp.storage.database import IN_MEMORY_DB
+from ib_sec_mcp.storage.migrations import verify_schema
 from ib_sec_mcp.storage.position_store import PositionStore
 
 # ---------------------------------------------------------------------------
@@ -22,16 +26,33 @@ FROM_DATE = date(2025, 1, 1)
 TO_DATE = date(2025, 1, 31)
 
 
+@functools.lru_cache(maxsize=256)
+def _dec(value: str) -> Decimal:
+    """Parse a Decimal literal once; Decimal is immutable, so instances are shared safely."""
+    return Decimal(value)
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
+#
+# The store is in-memory; only TestPositionStoreContextManager opens a file
+# under tmp_path.
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def shared_store() -> PositionStore:
+    with PositionStore(IN_MEMORY_DB) as store:
+        yield store
+
+
 @pytest.fixture
-def store(tmp_path: Path) -> PositionStore:
-    store = PositionStore(tmp_path / "test_positions.db")
-    yield store
-    store.close()
+def store(shared_store: PositionStore) -> PositionStore:
+    """Module-wide store; each test runs inside a savepoint that is rolled back after it."""
+    shared_store.db.execute("SAVEPOINT test_case")
+    yield shared_store
+    shared_store.db.execute("ROLLBACK TO test_case")
+    shared_store.db.execute("RELEASE test_case")
 
 
 def make_position(
@@ -54,19 +75,19 @@ def make_position(
         symbol=symbol,
         description=f"{symbol} Inc",
         asset_class=asset_class,
-        quantity=Decimal(quantity),
-        mark_price=Decimal(mark_price),
-        position_value=Decimal(position_value),
-        average_cost=Decimal(average_cost),
-        cost_basis=Decimal(cost_basis),
-        unrealized_pnl=Decimal(unrealized_pnl),
+        quantity=_dec(quantity),
+        mark_price=_dec(mark_price),
+        position_value=_dec(position_value),
+        average_cost=_dec(average_cost),
+        cost_basis=_dec(cost_basis),
+        unrealized_pnl=_dec(unrealized_pnl),
         currency="USD",
-        fx_rate_to_base=Decimal("1.0"),
+        fx_rate_to_base=_dec("1.0"),
         position_date=SNAP_DATE_1,
-        coupon_rate=Decimal(coupon_rate) if coupon_rate else None,
+        coupon_rate=_dec(coupon_rate) if coupon_rate else None,
         maturity_date=maturity_date,
-        ytm=Decimal(ytm) if ytm else None,
-        duration=Decimal(duration) if duration else None,
+        ytm=_dec(ytm) if ytm else None,
+        duration=_dec(duration) if duration else None,
     )
 
 
@@ -83,9 +104,9 @@ def make_account(
         cash_balances=[
             CashBalance(
                 currency="USD",
-                starting_cash=Decimal("1000"),
-                ending_cash=Decimal("1000"),
-                ending_settled_cash=Decimal("1000"),
+                starting_cash=_dec("1000"),
+                ending_cash=_dec("1000"),
+                ending_settled_cash=_dec("1000"),
             )
         ],
         positions=positions or [],
@@ -157,6 +178,20 @@ class TestPositionStoreSaveSnapshot:
         assert len(snapshot) == 1
         assert snapshot[0]["position_value"] == Decimal("1600")
 
+    def test_save_duplicate_updates_in_place(self, store: PositionStore) -> None:
+        account = make_account(positions=[make_position(position_value="1500")])
+        store.save_snapshot(account, SNAP_DATE_1, "/data/2025-01.xml")
+        query = "SELECT id FROM position_snapshots WHERE symbol = ?"
+        first = store.db.fetchone(query, ("AAPL",))
+
+        account2 = make_account(positions=[make_position(position_value="1600")])
+        store.save_snapshot(account2, SNAP_DATE_1, "/data/2025-01-updated.xml")
+        second = store.db.fetchone(query, ("AAPL",))
+
+        # Upsert keeps the original row rather than deleting and re-inserting it
+        assert first is not None
+        assert second == first
+
     def test_decimal_precision_preserved(self, store: PositionStore) -> None:
         precise_value = "1234.56789012345"
         pos = make_position(position_value=precise_value)
@@ -167,6 +202,63 @@ class TestPositionStoreSaveSnapshot:
         assert len(history) == 1
         assert history[0]["position_value"] == Decimal(precise_value)
 
+    def test_asset_class_stored_as_code(self, store: PositionStore) -> None:
+        bond = make_position(symbol="T 4.5 2030", asset_class=AssetClass.BOND)
+        store.save_snapshot(make_account(positions=[bond]), SNAP_DATE_1, "/data/2025-01.xml")
+
+        row = store.db.fetchone(
+            "SELECT asset_class, typeof(asset_class) AS type FROM position_snapshots"
+        )
+        assert row == {"asset_class": "BOND", "type": "text"}
+
+    @pytest.mark.parametrize("n", [100, 1_000, 10_000])
+    def test_save_snapshot_bulk(self, store: PositionStore, n: int) -> None:
+        positions = [make_position(symbol=f"SYM{i:05d}") for i in range(n)]
+        account = make_account(positions=positions)
+
+        saved = store.save_snapshot(account, SNAP_DATE_1, "/data/2025-01.xml")
+
+        assert saved == n
+        row = store.db.fetchone(
+            "SELECT COUNT(*) AS n FROM position_snapshots WHERE account_id = ? AND snapshot_date = ?",
+            (ACCOUNT_ID, SNAP_DATE_1.isoformat()),
+        )
+        assert row is not None
+        assert row["n"] == n
+
+
+# ---------------------------------------------------------------------------
+# TestPositionStoreBulkLoad
+# ---------------------------------------------------------------------------
+
+
+class TestPositionStoreBulkLoad:
+    def test_bulk_load_multiple_snapshots(self, store: PositionStore) -> None:
+        account1 = make_account(positions=[make_position("U1234567", "AAPL")])
+        account2 = make_account(
+            account_id="U7654321",
+            positions=[make_position("U7654321", "MSFT"), make_position("U7654321", "GOOG")],
+        )
+
+        saved = store.bulk_load(
+            [
+                (account1, SNAP_DATE_1, "/data/2025-01.xml"),
+                (account2, SNAP_DATE_2, "/data/2025-02.xml"),
+            ]
+        )
+
+        assert saved == 3
+        assert len(store.get_portfolio_snapshot("U1234567", SNAP_DATE_1)) == 1
+        assert len(store.get_portfolio_snapshot("U7654321", SNAP_DATE_2)) == 2
+        assert store.get_available_dates("U7654321") == [SNAP_DATE_2.isoformat()]
+
+    def test_bulk_load_rebuilds_indexes(self, store: PositionStore) -> None:
+        account = make_account(positions=[make_position()])
+
+        store.bulk_load([(account, SNAP_DATE_1, "/data/2025-01.xml")])
+
+        assert verify_schema(store.db)
+
 
 # ---------------------------------------------------------------------------
 # TestPositionStoreGetHistory
@@ -234,6 +326,26 @@ class TestPositionStoreGetPortfolioSnapshot:
         values = [row["position_value"] for row in snapshot]
         assert values == sorted(values, reverse=True)
 
+    def test_get_portfolio_snapshot_orders_numerically(self, store: PositionStore) -> None:
+        # As TEXT, "900" > "5000" > "10000" > "-50"
+        positions = [
+            make_position(symbol="AAPL", position_value="900"),
+            make_position(symbol="MSFT", position_value="10000"),
+            make_position(symbol="GOOG", position_value="-50"),
+            make_position(symbol="AMZN", position_value="5000"),
+        ]
+        store.save_snapshot(make_account(positions=positions), SNAP_DATE_1, "/data/jan.xml")
+
+        snapshot = store.get_portfolio_snapshot(ACCOUNT_ID, SNAP_DATE_1)
+        assert [row["symbol"] for row in snapshot] == ["MSFT", "AMZN", "AAPL", "GOOG"]
+
+    def test_get_portfolio_snapshot_avoids_sort(self, store: PositionStore) -> None:
+        plan = store.db.explain_query_plan(
+            PositionStore._SQL_GET_SNAPSHOT, (ACCOUNT_ID, SNAP_DATE_1.isoformat())
+        )
+        assert any("idx_account_date_value" in step for step in plan)
+        assert not any("TEMP B-TREE" in step for step in plan)
+
     def test_get_portfolio_snapshot_empty(self, store: PositionStore) -> None:
         snapshot = store.get_portfolio_snapshot(ACCOUNT_ID, SNAP_DATE_1)
         assert snapshot == []
@@ -274,6 +386,23 @@ class TestPositionStoreCompare:
         assert comparison["date1"] == SNAP_DATE_1.isoformat()
         assert comparison["date2"] == SNAP_DATE_2.isoformat()
 
+    def test_compare_snapshots_totals_include_added_and_removed(self, store: PositionStore) -> None:
+        positions_1 = [make_position(symbol="AAPL"), make_position(symbol="MSFT")]
+        store.save_snapshot(make_account(positions=positions_1), SNAP_DATE_1, "/data/jan.xml")
+        positions_2 = [
+            make_position(symbol="AAPL", position_value="1800"),
+            make_position(symbol="GOOG", position_value="700"),
+        ]
+        account_2 = make_account(positions=positions_2, from_date=SNAP_DATE_2, to_date=SNAP_DATE_2)
+        store.save_snapshot(account_2, SNAP_DATE_2, "/data/feb.xml")
+
+        comparison = store.compare_portfolio_snapshots(ACCOUNT_ID, SNAP_DATE_1, SNAP_DATE_2)
+        assert comparison["positions_added"] == ["GOOG"]
+        assert comparison["positions_removed"] == ["MSFT"]
+        assert comparison["total_value_date1"] == Decimal("3000.00")
+        assert comparison["total_value_date2"] == Decimal("2500")
+        assert [c["symbol"] for c in comparison["positions_changed"]] == ["AAPL"]
+
     def test_compare_snapshots_value_changes(self, store: PositionStore) -> None:
         pos1 = make_position(symbol="AAPL", position_value="1000")
         account_1 = make_account(positions=[pos1])
@@ -323,6 +452,55 @@ class TestPositionStoreStatistics:
         assert stats["value_statistics"]["min"] == Decimal("1000")
         assert stats["value_statistics"]["max"] == Decimal("1200")
 
+    def test_get_position_statistics_compares_numerically(self, store: PositionStore) -> None:
+        # As TEXT, "100" < "99" and "-5" > "-10"
+        pos1 = make_position(mark_price="99", position_value="990", unrealized_pnl="-5")
+        store.save_snapshot(make_account(positions=[pos1]), SNAP_DATE_1, "/data/jan.xml")
+        pos2 = make_position(mark_price="100", position_value="1000", unrealized_pnl="-10")
+        account2 = make_account(positions=[pos2], from_date=SNAP_DATE_2, to_date=SNAP_DATE_2)
+        store.save_snapshot(account2, SNAP_DATE_2, "/data/feb.xml")
+
+        stats = store.get_position_statistics(ACCOUNT_ID, "AAPL", SNAP_DATE_1, SNAP_DATE_2)
+        assert stats["price_statistics"]["min"] == Decimal("99")
+        assert stats["price_statistics"]["max"] == Decimal("100")
+        assert stats["value_statistics"]["max"] == Decimal("1000")
+        assert stats["pnl_statistics"]["min"] == Decimal("-10")
+
+    def test_get_position_statistics_preserves_precision(self, store: PositionStore) -> None:
+        # Each pair is equal once cast to REAL; only an exact comparison orders them
+        pos1 = make_position(
+            mark_price="123456789.123456790",
+            position_value="1234567890123.4567891",
+            unrealized_pnl="0.10",
+        )
+        store.save_snapshot(make_account(positions=[pos1]), SNAP_DATE_1, "/data/jan.xml")
+        pos2 = make_position(
+            mark_price="123456789.123456789",
+            position_value="1234567890123.4567892",
+            unrealized_pnl="1234.56789012345",
+        )
+        account2 = make_account(positions=[pos2], from_date=SNAP_DATE_2, to_date=SNAP_DATE_2)
+        store.save_snapshot(account2, SNAP_DATE_2, "/data/feb.xml")
+
+        stats = store.get_position_statistics(ACCOUNT_ID, "AAPL", SNAP_DATE_1, SNAP_DATE_2)
+        assert str(stats["price_statistics"]["min"]) == "123456789.123456789"
+        assert str(stats["price_statistics"]["max"]) == "123456789.123456790"
+        assert str(stats["value_statistics"]["min"]) == "1234567890123.4567891"
+        assert str(stats["value_statistics"]["max"]) == "1234567890123.4567892"
+        assert str(stats["pnl_statistics"]["min"]) == "0.10"
+        assert str(stats["pnl_statistics"]["max"]) == "1234.56789012345"
+
+    def test_get_position_statistics_orders_negative_ties(self, store: PositionStore) -> None:
+        pos1 = make_position(unrealized_pnl="-123456789.123456789")
+        store.save_snapshot(make_account(positions=[pos1]), SNAP_DATE_1, "/data/jan.xml")
+        pos2 = make_position(unrealized_pnl="-123456789.123456790")
+        account2 = make_account(positions=[pos2], from_date=SNAP_DATE_2, to_date=SNAP_DATE_2)
+        store.save_snapshot(account2, SNAP_DATE_2, "/data/feb.xml")
+
+        stats = store.get_position_statistics(ACCOUNT_ID, "AAPL", SNAP_DATE_1, SNAP_DATE_2)
+        assert str(stats["pnl_statistics"]["min"]) == "-123456789.123456790"
+        assert str(stats["pnl_statistics"]["max"]) == "-123456789.123456789"
+
     def test_get_position_statistics_no_data(self, store: PositionStore) -> None:
         stats = store.get_position_statistics(ACCOUNT_ID, "AAPL", SNAP_DATE_1, SNAP_DATE_2)
         assert stats["snapshot_count"] == 0
@@ -365,6 +543,34 @@ class TestPositionStoreAvailableDates:
         # Should be ordered DESC (most recent first)
         assert dates[0] > dates[1]
 
+    def test_get_available_dates_uses_covering_index(self, store: PositionStore) -> None:
+        plan = store.db.explain_query_plan(PositionStore._SQL_GET_DATES, (ACCOUNT_ID,))
+        assert any("COVERING INDEX" in step for step in plan)
+        assert not any("TEMP B-TREE" in step for step in plan)
+
+
+# ---------------------------------------------------------------------------
+# TestPositionStoreTransaction
+#
+# Uses its own store: the shared ``store`` fixture wraps every test in a
+# savepoint, so only the nested branch of DatabaseConnection.transaction runs.
+# ---------------------------------------------------------------------------
+
+
+class TestPositionStoreTransaction:
+    def test_failed_save_persists_nothing(self) -> None:
+        # Unvalidated position whose NULL mark_price violates NOT NULL, after the
+        # metadata row and the first position have been written
+        bad = make_position(symbol="MSFT").model_copy(update={"mark_price": None})
+        account = make_account(positions=[make_position(symbol="AAPL"), bad])
+
+        with PositionStore(IN_MEMORY_DB) as store:
+            with pytest.raises(sqlite3.IntegrityError):
+                store.save_snapshot(account, SNAP_DATE_1, "/data/2025-01.xml")
+
+            assert store.get_available_dates(ACCOUNT_ID) == []
+            assert store.get_portfolio_snapshot(ACCOUNT_ID, SNAP_DATE_1) == []
+
 
 # ---------------------------------------------------------------------------
 # TestPositionStoreContextManager
@@ -379,3 +585,10 @@ class TestPositionStoreContextManager:
             account = make_account(positions=[pos])
             saved = store.save_snapshot(account, SNAP_DATE_1, "/data/jan.xml")
             assert saved == 1
+
+    def test_read_tuned_pragmas(self, tmp_path: Path) -> None:
+        with PositionStore(tmp_path / "pragmas.db") as store:
+            mmap_size = store.db.fetchone("PRAGMA mmap_size")
+            cache_size = store.db.fetchone("PRAGMA cache_size")
+        assert mmap_size == {"mmap_size": 1073741824}
+        assert cache_size == {"cache_size": -204800}